@@ -5,13 +5,20 @@ Connects to AnnexCI platform for real-time compliance management.
 """
 
 import argparse
+import ast
 import json
 import os
 import sys
 import time
 import hashlib
+import mmap
+import re
 import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 
 # Configuration
 API_URL = os.environ.get('ANNEXCI_API_URL', 'http://localhost:3001')
@@ -28,8 +35,34 @@ class Colors:
     BOLD = '\033[1m'
     DIM = '\033[2m'
     RESET = '\033[0m'
+    
+    @classmethod
+    def disable(cls):
+        for name in ('HEADER', 'BLUE', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'BOLD', 'DIM', 'RESET'):
+            setattr(cls, name, '')
+
+# Interactive mode animates steps and prints banners; CI mode (--ci, or
+# whenever stdout is not a terminal) does neither and prints JSON results.
+INTERACTIVE = True
+
+def set_interactive(interactive):
+    global INTERACTIVE
+    INTERACTIVE = interactive
+    if not interactive:
+        Colors.disable()
+
+def pause(seconds):
+    """Visual pacing for interactive use; a no-op in CI mode"""
+    if INTERACTIVE:
+        time.sleep(seconds)
+
+def notice(message):
+    """Human-readable message; goes to stderr in CI mode so stdout stays JSON"""
+    print(message, file=sys.stdout if INTERACTIVE else sys.stderr)
 
 def print_header():
+    if not INTERACTIVE:
+        return
     print(f"""
 {Colors.CYAN}{Colors.BOLD}
     ╔═══════════════════════════════════════════════════════════════╗
@@ -47,6 +80,10 @@ def print_header():
 {Colors.RESET}""")
 
 def print_step(message, status='running'):
+    if not INTERACTIVE:
+        if status != 'running':
+            print(f"{'ok' if status == 'done' else 'FAIL'}: {message}", file=sys.stderr)
+        return
     if status == 'running':
         print(f"  {Colors.YELLOW}►{Colors.RESET} {message}...", end='', flush=True)
     elif status == 'done':
@@ -54,22 +91,125 @@ def print_step(message, status='running'):
     elif status == 'fail':
         print(f"\r  {Colors.RED}✗{Colors.RESET} {message}    ")
 
+# ============================================
+# Platform API client
+# ============================================
+
+class AnnexCIError(Exception):
+    """A failure the CLI reports to the user and exits on; hint is an optional next step"""
+    
+    def __init__(self, message, hint=None):
+        super().__init__(message)
+        self.hint = hint
+
+# (connect, read) timeouts in seconds per endpoint
+DEFAULT_TIMEOUT = (3.05, 10)
+ENDPOINT_TIMEOUTS = {
+    '/api/scan': (3.05, 30),
+    '/api/scan/bulk': (3.05, 120),
+    '/api/token/validate': (3.05, 10),
+    '/api/deploy': (3.05, 15),
+}
+
+RETRY_STATUSES = (429, 502, 503, 504)
+# A 502/504 may come back after the platform already applied the request,
+# so POSTs are only resent on statuses that mean it was turned away
+POST_RETRY_STATUSES = (429, 503)
+
+class _PlatformRetry(Retry):
+    """Retry policy that never resends a POST the platform may have applied"""
+    
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == 'POST' and status_code not in POST_RETRY_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+class AnnexCIClient:
+    """
+    Keep-alive HTTP client for the AnnexCI platform.
+    
+    Connections are pooled per host and shared between threads. Connection
+    failures and retryable statuses are retried with exponential backoff;
+    read timeouts, and 502/504 answers to a POST, are not, since the
+    platform may already have applied the request.
+    """
+    
+    def __init__(self, base_url=None, retries=3, backoff=0.25, pool_size=16, timeouts=None):
+        self.base_url = (base_url or API_URL).rstrip('/')
+        self.timeouts = dict(ENDPOINT_TIMEOUTS, **(timeouts or {}))
+        retry = _PlatformRetry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({'GET', 'POST'}),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def request(self, method, endpoint, data=None, timeout=None, missing_ok=False):
+        """Call an endpoint and return its decoded JSON body (None on 404 if missing_ok)"""
+        url = f"{self.base_url}{endpoint}"
+        timeout = timeout or self.timeouts.get(endpoint, DEFAULT_TIMEOUT)
+        try:
+            resp = self.session.request(method, url, json=data, timeout=timeout)
+        except requests.exceptions.RetryError as e:
+            raise AnnexCIError(f"{method} {endpoint} failed: server kept returning a retryable status") from e
+        except requests.exceptions.ConnectionError as e:
+            # With read retries disabled, requests reports read timeouts as ConnectionError
+            if isinstance(getattr(e.args[0] if e.args else None, 'reason', None), ReadTimeoutError):
+                raise AnnexCIError(f"{method} {endpoint} timed out") from e
+            raise AnnexCIError(
+                f"Cannot connect to AnnexCI server at {self.base_url}",
+                hint="Make sure the API server is running: cd packages/api && npm start",
+            ) from e
+        except requests.exceptions.Timeout as e:
+            raise AnnexCIError(f"{method} {endpoint} timed out") from e
+        except requests.exceptions.RequestException as e:
+            raise AnnexCIError(f"{method} {endpoint} failed: {e}") from e
+        
+        if missing_ok and resp.status_code == 404:
+            return None
+        # 4xx bodies carry the platform's answer (e.g. an invalid token reason)
+        if resp.status_code >= 500:
+            raise AnnexCIError(f"{method} {endpoint} failed: HTTP {resp.status_code}")
+        try:
+            return resp.json()
+        except ValueError as e:
+            raise AnnexCIError(f"{method} {endpoint} returned HTTP {resp.status_code} with a non-JSON body") from e
+    
+    def get(self, endpoint, timeout=None):
+        return self.request('GET', endpoint, timeout=timeout)
+    
+    def post(self, endpoint, data=None, timeout=None, missing_ok=False):
+        return self.request('POST', endpoint, data, timeout=timeout, missing_ok=missing_ok)
+    
+    def close(self):
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+_client = None
+
+def get_client():
+    """Process-wide client, created on first use"""
+    global _client
+    if _client is None:
+        _client = AnnexCIClient()
+    return _client
+
 def api_call(method, endpoint, data=None):
-    """Make API call to AnnexCI server"""
-    url = f"{API_URL}{endpoint}"
-    try:
-        if method == 'GET':
-            resp = requests.get(url, timeout=10)
-        else:
-            resp = requests.post(url, json=data, timeout=10)
-        return resp.json()
-    except requests.exceptions.ConnectionError:
-        print(f"\n{Colors.RED}Error: Cannot connect to AnnexCI server at {API_URL}{Colors.RESET}")
-        print(f"{Colors.DIM}Make sure the API server is running: cd packages/api && npm start{Colors.RESET}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n{Colors.RED}Error: {e}{Colors.RESET}")
-        sys.exit(1)
+    """Make API call to AnnexCI server; raises AnnexCIError on failure"""
+    return get_client().request(method, endpoint, data)
 
 # ============================================
 # INIT Command
@@ -248,13 +388,14 @@ compliance:
 def cmd_init(args):
     """Initialize compliance structure in current directory"""
     print_header()
-    print(f"\n{Colors.BOLD}Initializing AnnexCI compliance structure...{Colors.RESET}\n")
+    if INTERACTIVE:
+        print(f"\n{Colors.BOLD}Initializing AnnexCI compliance structure...{Colors.RESET}\n")
     
     compliance_dir = Path('compliance')
     
     if compliance_dir.exists() and not args.force:
-        print(f"{Colors.YELLOW}Warning: compliance/ directory already exists.{Colors.RESET}")
-        print(f"Use --force to overwrite.\n")
+        notice(f"{Colors.YELLOW}Warning: compliance/ directory already exists.{Colors.RESET}")
+        notice(f"Use --force to overwrite.\n")
         return
     
     compliance_dir.mkdir(exist_ok=True)
@@ -270,18 +411,22 @@ def cmd_init(args):
     for filename, content in templates.items():
         filepath = compliance_dir / filename
         print_step(f"Creating {filename}", 'running')
-        time.sleep(0.3)
+        pause(0.3)
         with open(filepath, 'w') as f:
             f.write(content)
         print_step(f"Creating {filename}", 'done')
     
     # Create config file in root
     print_step("Creating annexci.yaml", 'running')
-    time.sleep(0.3)
+    pause(0.3)
     with open('annexci.yaml', 'w') as f:
         f.write(TEMPLATE_CONFIG)
     print_step("Creating annexci.yaml", 'done')
     
+    if not INTERACTIVE:
+        print(json.dumps({'created': [f'compliance/{name}' for name in templates] + ['annexci.yaml']}))
+        return
+    
     print(f"""
 {Colors.GREEN}{Colors.BOLD}✓ Compliance structure initialized{Colors.RESET}
 
@@ -303,210 +448,674 @@ def cmd_init(args):
 # SCAN Command
 # ============================================
 
-def validate_risk_register(content):
-    """Validate RISK_REGISTER.yaml"""
-    errors = []
-    warnings = []
-    
-    if '[YOUR SYSTEM NAME]' in content or 'risks: []' in content:
-        errors.append('RISK_REGISTER.yaml: No risks defined (template not filled)')
-    elif 'risks:' not in content:
-        errors.append('RISK_REGISTER.yaml: Missing risks section')
-    
-    if 'residual_risk_assessment' not in content:
-        warnings.append('RISK_REGISTER.yaml: Missing residual risk assessment')
-    
-    return errors, warnings
+class Finding:
+    """One scan result, routed to its article by the rule that produced it"""
+    __slots__ = ('rule_id', 'article', 'severity', 'file', 'line', 'message')
+    
+    def __init__(self, rule_id, article, severity, file, line, message):
+        self.rule_id = rule_id
+        self.article = article
+        self.severity = severity  # 'error' or 'warning'
+        self.file = file
+        self.line = line
+        self.message = message
+    
+    def __str__(self):
+        location = f'{self.file}:{self.line}' if self.line else self.file
+        return f'{location}: {self.message}'
+    
+    def __repr__(self):
+        return f'Finding({self.rule_id!r}, {self.article!r}, {self.severity!r}, {str(self)!r})'
+    
+    def to_dict(self):
+        return {
+            'ruleId': self.rule_id,
+            'article': self.article,
+            'severity': self.severity,
+            'file': self.file,
+            'line': self.line,
+            'message': self.message,
+        }
 
-def validate_data_card(content):
-    """Validate DATA_CARD.md"""
-    errors = []
-    warnings = []
-    
-    if '[System Name]' in content or '[Name]' in content:
-        errors.append('DATA_CARD.md: Template not filled in')
-    
-    if 'Bias Examination' not in content or '[REQUIRED' in content:
-        errors.append('DATA_CARD.md: Bias examination section incomplete (Article 10(2)(f))')
-    
-    if 'Data Gaps' not in content:
-        warnings.append('DATA_CARD.md: Data gaps section missing (Article 10(2)(h))')
-    
-    return errors, warnings
+# Compliance document rules. A rule fires when any of its `present` markers
+# occurs in the document or any of its `absent` markers does not, unless the
+# rule named by `unless` already fired. All markers of a document are
+# compiled into one regex, so each document is matched in a single pass.
+
+class DocumentRule:
+    __slots__ = ('rule_id', 'kind', 'article', 'message', 'present', 'absent', 'unless')
+    
+    def __init__(self, rule_id, kind, article, message, present=(), absent=(), unless=None):
+        self.rule_id = rule_id
+        self.kind = kind
+        self.article = article
+        self.message = message
+        self.present = tuple(present)
+        self.absent = tuple(absent)
+        self.unless = unless
+
+DOCUMENT_RULES = {
+    'RISK_REGISTER.yaml': [
+        DocumentRule('template-not-filled', 'error', 'Article 9', 'No risks defined (template not filled)',
+                     present=['[YOUR SYSTEM NAME]', 'risks: []']),
+        DocumentRule('missing-risks', 'error', 'Article 9', 'Missing risks section',
+                     absent=['risks:'], unless='template-not-filled'),
+        DocumentRule('missing-residual-risk', 'warning', 'Article 9', 'Missing residual risk assessment',
+                     absent=['residual_risk_assessment']),
+    ],
+    'DATA_CARD.md': [
+        DocumentRule('template-not-filled', 'error', 'Article 10', 'Template not filled in',
+                     present=['[System Name]', '[Name]']),
+        DocumentRule('bias-examination-incomplete', 'error', 'Article 10',
+                     'Bias examination section incomplete (Article 10(2)(f))',
+                     present=['[REQUIRED'], absent=['Bias Examination']),
+        DocumentRule('missing-data-gaps', 'warning', 'Article 10', 'Data gaps section missing (Article 10(2)(h))',
+                     absent=['Data Gaps']),
+    ],
+    'MODEL_CARD.md': [
+        DocumentRule('template-not-filled', 'error', 'Article 13', 'Template not filled in',
+                     present=['[System Name]', '[Name]']),
+        DocumentRule('missing-limitations', 'warning', 'Article 13', 'Limitations section missing',
+                     absent=['Limitations']),
+    ],
+    'HUMAN_OVERSIGHT.md': [
+        DocumentRule('template-not-filled', 'error', 'Article 14', 'Template not filled in',
+                     present=['[System Name]']),
+        DocumentRule('stop-mechanism-missing', 'error', 'Article 14',
+                     'Stop mechanism not documented (Article 14(4)(e))',
+                     present=['[REQUIRED'], absent=['Stop Mechanism']),
+    ],
+    'INSTRUCTIONS.md': [
+        DocumentRule('template-not-filled', 'error', 'Article 13', 'Template not filled in',
+                     present=['[System Name]']),
+    ],
+}
+
+class CompiledDocumentRules:
+    """All markers of one document's rules as a single alternation"""
+    
+    def __init__(self, rules):
+        self.rules = rules
+        markers = sorted({m for rule in rules for m in rule.present + rule.absent}, key=len, reverse=True)
+        # Longest first, so a marker that contains another (e.g. 'risks: []'
+        # and 'risks:') wins the match; the shorter one is implied.
+        self.pattern = re.compile('|'.join(map(re.escape, markers)))
+        self.implies = {m: [other for other in markers if other in m] for m in markers}
+    
+    def first_lines(self, content):
+        """Line of the first occurrence of each marker found in content"""
+        found = {}
+        line, pos = 1, 0
+        for match in self.pattern.finditer(content):
+            line += content.count('\n', pos, match.start())
+            pos = match.start()
+            for marker in self.implies[match.group()]:
+                found.setdefault(marker, line)
+        return found
+    
+    def check(self, filename, content):
+        """[Finding]; line is None for missing sections"""
+        found = self.first_lines(content)
+        fired = set()
+        findings = []
+        for rule in self.rules:
+            if rule.unless in fired:
+                continue
+            lines = [found[m] for m in rule.present if m in found]
+            if lines or any(m not in found for m in rule.absent):
+                fired.add(rule.rule_id)
+                findings.append(Finding(rule.rule_id, rule.article, rule.kind, filename,
+                                        min(lines) if lines else None, rule.message))
+        return findings
+
+_COMPILED_DOCUMENT_RULES = {name: CompiledDocumentRules(rules) for name, rules in DOCUMENT_RULES.items()}
+
+# Cached document findings are only reused while the rule table is unchanged
+_DOCUMENT_RULES_SIGNATURE = hashlib.blake2b(repr([
+    (name, [(r.rule_id, r.kind, r.article, r.message, r.present, r.absent, r.unless) for r in rules])
+    for name, rules in DOCUMENT_RULES.items()
+]).encode(), digest_size=8).hexdigest()
+
+# Article a document belongs to, for findings about the file itself
+DOCUMENT_ARTICLES = {name: rules[0].article for name, rules in DOCUMENT_RULES.items()}
+
+def check_document(filename, content):
+    """Run the rules for one compliance document in a single pass over its text"""
+    return _COMPILED_DOCUMENT_RULES[filename].check(filename, content)
 
-def validate_model_card(content):
-    """Validate MODEL_CARD.md"""
-    errors = []
-    warnings = []
-    
-    if '[System Name]' in content or '[Name]' in content:
-        errors.append('MODEL_CARD.md: Template not filled in')
-    
-    if 'Limitations' not in content:
-        warnings.append('MODEL_CARD.md: Limitations section missing')
-    
-    return errors, warnings
+# ============================================
+# Source scan rules (Article 15)
+# ============================================
 
-def validate_human_oversight(content):
-    """Validate HUMAN_OVERSIGHT.md"""
-    errors = []
-    warnings = []
-    
-    if '[System Name]' in content:
-        errors.append('HUMAN_OVERSIGHT.md: Template not filled in')
-    
-    if 'Stop Mechanism' not in content or '[REQUIRED' in content:
-        errors.append('HUMAN_OVERSIGHT.md: Stop mechanism not documented (Article 14(4)(e))')
+class SourceRule:
+    """A call-site rule: fires on calls to any of `calls` unless check() clears it"""
+    __slots__ = ('rule_id', 'calls', 'kind', 'message', 'check', 'article')
+    
+    def __init__(self, rule_id, calls, kind, message, check=None, article='Article 15'):
+        self.rule_id = rule_id
+        self.calls = frozenset(calls)
+        self.kind = kind
+        self.message = message
+        self.check = check
+        self.article = article
+
+SOURCE_RULES = []
+_RULES_BY_CALL = {}  # fully qualified call name -> [SourceRule]
+_SOURCE_RULES_BY_ID = {}
+
+def register_source_rule(rule_id, calls, kind, message, check=None, article='Article 15'):
+    """Add a rule; every rule is evaluated in the same single walk of each file"""
+    rule = SourceRule(rule_id, calls, kind, message, check, article)
+    SOURCE_RULES.append(rule)
+    _SOURCE_RULES_BY_ID[rule_id] = rule
+    for name in rule.calls:
+        _RULES_BY_CALL.setdefault(name, []).append(rule)
+    return rule
+
+def _keyword(call, name):
+    return next((kw.value for kw in call.keywords if kw.arg == name), None)
+
+def _torch_load_unsafe(call, resolve):
+    if any(kw.arg is None for kw in call.keywords):
+        return False  # **kwargs: cannot tell
+    weights_only = _keyword(call, 'weights_only')
+    return not (isinstance(weights_only, ast.Constant) and weights_only.value is True)
+
+def _yaml_load_unsafe(call, resolve):
+    loader = _keyword(call, 'Loader')
+    if loader is None and len(call.args) > 1:
+        loader = call.args[1]
+    name = resolve(loader) if loader is not None else None
+    return not (name and name.rsplit('.', 1)[-1] in ('SafeLoader', 'CSafeLoader', 'BaseLoader'))
+
+register_source_rule(
+    'unsafe-deserialization',
+    ['pickle.load', 'pickle.loads', 'pickle.Unpickler', '_pickle.load', '_pickle.loads',
+     'cPickle.load', 'cPickle.loads', 'dill.load', 'dill.loads', 'marshal.load', 'marshal.loads',
+     'joblib.load', 'sklearn.externals.joblib.load', 'pandas.read_pickle',
+     'yaml.unsafe_load', 'yaml.unsafe_load_all'],
+    'error', 'Unsafe deserialization ({call}) - Article 15 violation',
+)
+register_source_rule(
+    'unsafe-yaml-load', ['yaml.load', 'yaml.load_all'],
+    'error', 'Unsafe deserialization ({call} without SafeLoader) - Article 15 violation',
+    check=_yaml_load_unsafe,
+)
+register_source_rule(
+    'torch-load-weights-only', ['torch.load'],
+    'error', 'Unsafe deserialization (torch.load without weights_only=True) - Article 15 violation',
+    check=_torch_load_unsafe,
+)
+register_source_rule(
+    'dynamic-code-execution', ['eval', 'exec'],
+    'warning', '{call}() detected - potential security risk',
+)
+
+# Used for files that do not parse (e.g. Python 2 sources)
+FALLBACK_PATTERN = re.compile(r'(?P<pickle>pickle\.loads?)\b|\b(?P<eval>eval|exec)\(')
+FALLBACK_RULES = {'pickle': 'unsafe-deserialization', 'eval': 'dynamic-code-execution'}
+
+class _ImportResolver:
+    """Maps local names to fully qualified names using the file's imports"""
+    
+    def __init__(self):
+        self.aliases = {}
+    
+    def add(self, node):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    self.aliases[alias.asname] = alias.name
+                else:
+                    top = alias.name.split('.', 1)[0]
+                    self.aliases[top] = top
+        elif node.module and not node.level:
+            for alias in node.names:
+                self.aliases[alias.asname or alias.name] = f'{node.module}.{alias.name}'
+    
+    def __call__(self, node):
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return ''
+        parts.append(self.aliases.get(node.id, node.id))
+        return '.'.join(reversed(parts))
+
+def check_source(content):
+    """Run every registered rule over one file; returns [kind, line, message, rule_id] findings"""
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        rules = {rule.rule_id: rule for rule in SOURCE_RULES}
+        findings = []
+        line, pos = 1, 0
+        for match in FALLBACK_PATTERN.finditer(content):
+            line += content.count('\n', pos, match.start())
+            pos = match.start()
+            rule = rules[FALLBACK_RULES[match.lastgroup]]
+            call = match.group(match.lastgroup)
+            findings.append([rule.kind, line, rule.message.format(call=call), rule.rule_id])
+        return findings
+    
+    # One walk collects imports and calls; calls are resolved once imports are known
+    resolve = _ImportResolver()
+    calls = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            calls.append(node)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            resolve.add(node)
+    
+    findings = []
+    for call in calls:
+        name = resolve(call.func)
+        for rule in _RULES_BY_CALL.get(name, ()):
+            if rule.check is None or rule.check(call, resolve):
+                findings.append([rule.kind, call.lineno, rule.message.format(call=name), rule.rule_id])
+    findings.sort(key=lambda f: f[1])
+    return findings
+
+# Directories never descended into (matched by name at any depth)
+SCAN_EXCLUDE_DIRS = {'compliance', '.venv', 'venv', '.git', '.annexci', 'node_modules', '__pycache__'}
+
+CACHE_DIR = Path('.annexci') / 'cache'
+SCAN_CACHE_FILE = CACHE_DIR / 'source-scan.json'
+SCAN_CACHE_VERSION = 2
+
+# Below this many changed files a process pool costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 64
+
+def discover_source_files(root='.'):
+    """Find Python files under root, pruning excluded directories; paths are relative to root"""
+    py_files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SCAN_EXCLUDE_DIRS]
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in filenames:
+            if name.endswith('.py'):
+                py_files.append(os.path.normpath(os.path.join(rel_dir, name)))
+    return py_files
+
+def scan_source_file(path, known_digest=None):
+    """Return (digest, findings) for one file; findings is None if the digest is known_digest"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None, []
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if digest == known_digest:
+        return digest, None
+    return digest, check_source(data.decode('utf-8', errors='replace'))
+
+def _rules_signature():
+    return hashlib.blake2b(repr([
+        (r.rule_id, sorted(r.calls), r.kind, r.message, r.article) for r in SOURCE_RULES
+    ]).encode(), digest_size=8).hexdigest()
+
+def load_scan_cache(root='.'):
+    try:
+        with open(Path(root) / SCAN_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != SCAN_CACHE_VERSION or cache.get('rules') != _rules_signature():
+        return {}
+    return cache.get('files', {})
+
+def save_scan_cache(files, root='.'):
+    cache_file = Path(root) / SCAN_CACHE_FILE
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({'version': SCAN_CACHE_VERSION, 'rules': _rules_signature(), 'files': files},
+                  f, separators=(',', ':'))
+    os.replace(tmp, cache_file)
+
+def scan_source_files(root='.', jobs=None, use_cache=True):
+    """Scan source files under root for security patterns; returns [Finding]"""
+    py_files = discover_source_files(root)
+    cached = load_scan_cache(root) if use_cache else {}
+    entries = {}
+    
+    # Files whose mtime and size are unchanged are not read at all
+    changed = []
+    for path in py_files:
+        try:
+            st = os.stat(os.path.join(root, path))
+        except OSError:
+            continue
+        entry = cached.get(path)
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            entries[path] = entry
+        else:
+            changed.append((path, st))
+    
+    # Touched but identical files are hashed, not parsed again
+    paths = [os.path.join(root, path) for path, _ in changed]
+    known = [cached.get(path, {}).get('digest') for path, _ in changed]
+    if len(paths) >= PARALLEL_SCAN_MIN_FILES and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(scan_source_file, paths, known, chunksize=32))
+    else:
+        results = [scan_source_file(path, digest) for path, digest in zip(paths, known)]
+    
+    for (path, st), (digest, findings) in zip(changed, results):
+        if digest is None:
+            continue
+        if findings is None:
+            findings = cached[path]['findings']
+        entries[path] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'digest': digest, 'findings': findings}
+    
+    # Cache entries are plain lists; the article comes from the rule
+    findings = []
+    for path in sorted(entries):
+        display = os.path.normpath(os.path.join(root, path))
+        for kind, line, message, rule_id in entries[path]['findings']:
+            findings.append(Finding(rule_id, _SOURCE_RULES_BY_ID[rule_id].article, kind, display, line, message))
+    
+    if use_cache and (changed or len(entries) != len(cached)):
+        try:
+            save_scan_cache(entries, root)
+        except OSError:
+            pass  # a read-only checkout still gets a full scan
     
-    return errors, warnings
+    return findings
 
-def validate_instructions(content):
-    """Validate INSTRUCTIONS.md"""
-    errors = []
-    warnings = []
-    
-    if '[System Name]' in content:
-        errors.append('INSTRUCTIONS.md: Template not filled in')
-    
-    return errors, warnings
+# ============================================
+# Hash manifest
+# ============================================
 
-def scan_source_files():
-    """Scan source files for security patterns"""
-    errors = []
-    warnings = []
-    
-    # Look for Python files
-    py_files = list(Path('.').rglob('*.py'))
-    py_files = [f for f in py_files if 'compliance' not in str(f) and '.venv' not in str(f)]
-    
-    for py_file in py_files[:10]:  # Limit for demo
+# Full sha256 digests of compliance documents and model weights, keyed by
+# path and validated by (mtime, size, inode): unchanged files are neither
+# read nor hashed again.
+MANIFEST_FILE = CACHE_DIR / 'manifest.json'
+MANIFEST_VERSION = 1
+MODEL_PATH = Path('models') / 'credit_model.safetensors'
+
+HASH_CHUNK = 8 * 1024 * 1024
+
+# Files modified this recently may change again within the same mtime tick,
+# so their digests are not trusted on the next run
+RACY_WINDOW_NS = 2_000_000_000
+
+def sha256_file(path):
+    """sha256 of a file, hashed in chunks from a read-only memory map"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for start in range(0, len(view), HASH_CHUNK):
+                    digest.update(view[start:start + HASH_CHUNK])
+    return digest.hexdigest()
+
+def _stat_key(st):
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+class HashManifest:
+    """
+    Persistent path -> sha256 manifest under root/.annexci/cache.
+    
+    Entries may carry extra cached data (e.g. document findings), which is
+    dropped whenever the file changes.
+    """
+    
+    def __init__(self, root='.', use_cache=True):
+        self.root = Path(root)
+        self.path = self.root / MANIFEST_FILE
+        self.use_cache = use_cache
+        self.entries = self._load() if use_cache else {}
+        self._dirty = False
+    
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}
+        return manifest.get('files', {})
+    
+    def lookup(self, rel_path, st):
+        """The entry for rel_path if the file is unchanged since it was recorded"""
+        entry = self.entries.get(str(rel_path))
+        if entry and entry['stat'] == _stat_key(st):
+            return entry
+        return None
+    
+    def record(self, rel_path, st, sha256, **extra):
+        entry = {'stat': _stat_key(st), 'sha256': sha256, **extra}
+        if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS:
+            self.entries[str(rel_path)] = entry
+            self._dirty = True
+        return entry
+    
+    def digests(self, rel_paths, jobs=None):
+        """{rel_path: sha256} for existing files; changed files are hashed concurrently"""
+        digests = {}
+        changed = []
+        for rel_path in rel_paths:
+            try:
+                st = os.stat(self.root / rel_path)
+            except OSError:
+                continue
+            entry = self.lookup(rel_path, st)
+            if entry:
+                digests[str(rel_path)] = entry['sha256']
+            else:
+                changed.append((rel_path, st))
+        
+        if changed:
+            # hashlib releases the GIL while hashing, so threads overlap I/O and hashing
+            with ThreadPoolExecutor(max_workers=jobs or min(8, len(changed))) as pool:
+                hashed = pool.map(lambda item: sha256_file(self.root / item[0]), changed)
+                for (rel_path, st), sha256 in zip(changed, hashed):
+                    digests[str(rel_path)] = self.record(rel_path, st, sha256)['sha256']
+        return digests
+    
+    def digest(self, rel_path):
+        """sha256 of one file, or None if it does not exist"""
+        return self.digests([rel_path]).get(str(rel_path))
+    
+    def save(self):
+        if not (self.use_cache and self._dirty):
+            return
         try:
-            content = py_file.read_text()
-            
-            # Check for pickle (security vulnerability)
-            if 'pickle.load' in content or 'pickle.loads' in content:
-                line_num = next((i+1 for i, line in enumerate(content.split('\n')) if 'pickle.load' in line), 0)
-                errors.append(f'{py_file}:{line_num}: Unsafe deserialization (pickle.load) - Article 15 violation')
-            
-            # Check for eval
-            if 'eval(' in content:
-                warnings.append(f'{py_file}: eval() detected - potential security risk')
-                
-        except Exception:
-            pass
-    
-    return errors, warnings
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump({'version': MANIFEST_VERSION, 'files': self.entries}, f, separators=(',', ':'))
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            pass  # read-only checkout: everything is simply hashed again next time
+
+COMPLIANCE_DOCUMENTS = list(DOCUMENT_RULES)
+
+ARTICLE_TITLES = {
+    'Article 9': 'Risk Management',
+    'Article 10': 'Data Governance',
+    'Article 13': 'Transparency',
+    'Article 14': 'Human Oversight',
+    'Article 15': 'Accuracy, Robustness, Security',
+}
+
+def group_by_article(findings):
+    """{article: [Finding]}; every article in ARTICLE_TITLES is present, even if empty"""
+    articles = {article: [] for article in ARTICLE_TITLES}
+    for finding in findings:
+        articles.setdefault(finding.article, []).append(finding)
+    return articles
+
+def run_scan(root='.', jobs=None, use_cache=True):
+    """
+    Validate the compliance documents in root/compliance and scan the
+    source files under root.
+    
+    Returns a dict with passed, findings ([Finding]), errors and warnings
+    (their messages), articles (article -> [Finding]), documents (name,
+    size, sha256), model (path, sha256 of MODEL_PATH, or None) and missing.
+    Prints nothing, so it can be reused by other commands.
+    """
+    manifest = HashManifest(root, use_cache)
+    findings = []
+    documents = []
+    missing = []
+    
+    for filename in COMPLIANCE_DOCUMENTS:
+        rel_path = Path('compliance') / filename
+        try:
+            st = os.stat(manifest.root / rel_path)
+        except FileNotFoundError:
+            missing.append(filename)
+            findings.append(Finding('file-missing', DOCUMENT_ARTICLES[filename], 'error', filename, None, 'File missing'))
+            continue
+        
+        # Unchanged documents reuse their digest and findings without being read
+        entry = manifest.lookup(rel_path, st)
+        if entry is None or entry.get('rules') != _DOCUMENT_RULES_SIGNATURE:
+            data = (manifest.root / rel_path).read_bytes()
+            doc_findings = check_document(filename, data.decode('utf-8', errors='replace'))
+            entry = manifest.record(
+                rel_path, st, hashlib.sha256(data).hexdigest(),
+                rules=_DOCUMENT_RULES_SIGNATURE,
+                findings=[[f.rule_id, f.article, f.severity, f.line, f.message] for f in doc_findings],
+            )
+        documents.append({'name': filename, 'size': st.st_size, 'sha256': entry['sha256']})
+        findings.extend(
+            Finding(rule_id, article, severity, filename, line, message)
+            for rule_id, article, severity, line, message in entry['findings']
+        )
+    
+    # Model weights can be several GB; only hashed again when they change
+    model_sha256 = manifest.digest(MODEL_PATH)
+    model = None
+    if model_sha256 is not None:
+        model = {'path': str(MODEL_PATH), 'sha256': model_sha256}
+    manifest.save()
+    
+    findings.extend(scan_source_files(root, jobs=jobs, use_cache=use_cache))
+    
+    errors = [f for f in findings if f.severity == 'error']
+    return {
+        'passed': not errors,
+        'findings': findings,
+        'errors': [str(f) for f in errors],
+        'warnings': [str(f) for f in findings if f.severity == 'warning'],
+        'articles': group_by_article(findings),
+        'documents': documents,
+        'model': model,
+        'missing': missing,
+    }
+
+def scan_payload(result, system_id=None):
+    """Body of a /api/scan request for one system"""
+    return {
+        'systemId': system_id or SYSTEM_ID,
+        'results': {
+            'errors': result['errors'],
+            'warnings': result['warnings'],
+            'findings': [f.to_dict() for f in result['findings']],
+            'documents': [doc['name'] for doc in result['documents']],
+            'documentHashes': {doc['name']: f"sha256:{doc['sha256']}" for doc in result['documents']},
+            'modelHash': f"sha256:{result['model']['sha256']}" if result['model'] else None,
+            'passed': result['passed'],
+        },
+    }
+
+def upload_scan_results(result, system_id=None):
+    """Send a scan result to the platform"""
+    return api_call('POST', '/api/scan', scan_payload(result, system_id))
+
+def scan_report(result):
+    """Machine-readable form of a scan result (CI mode output)"""
+    return {
+        'passed': result['passed'],
+        'errors': result['errors'],
+        'warnings': result['warnings'],
+        'findings': [f.to_dict() for f in result['findings']],
+        'articles': {
+            article: {
+                'title': ARTICLE_TITLES.get(article, ''),
+                'errors': [str(f) for f in items if f.severity == 'error'],
+                'warnings': [str(f) for f in items if f.severity == 'warning'],
+            }
+            for article, items in result['articles'].items()
+        },
+        'documents': {doc['name']: f"sha256:{doc['sha256']}" for doc in result['documents']},
+        'model': {result['model']['path']: f"sha256:{result['model']['sha256']}"} if result['model'] else {},
+        'missing': result['missing'],
+    }
 
 def cmd_scan(args):
     """Run compliance scan"""
-    print_header()
-    
-    print(f"\n{Colors.DIM}Validating license...{Colors.RESET}", end=" ")
-    time.sleep(0.5)
-    print(f"{Colors.GREEN}✓ Licensed to Demo Partner LLP → Acme Corp{Colors.RESET}")
-    print(f"{Colors.DIM}License valid until: 2027-01-29{Colors.RESET}\n")
-    
     compliance_dir = Path('compliance')
     if not compliance_dir.exists():
+        if not INTERACTIVE:
+            print(json.dumps({'passed': False, 'errors': ['compliance/ directory not found']}))
+            sys.exit(1)
         print(f"{Colors.RED}Error: compliance/ directory not found.{Colors.RESET}")
         print(f"Run {Colors.CYAN}annexci init{Colors.RESET} first.\n")
         sys.exit(1)
     
-    all_errors = []
-    all_warnings = []
+    if not INTERACTIVE:
+        result = run_scan('.', jobs=args.jobs, use_cache=not args.no_cache)
+        print(json.dumps(scan_report(result), indent=2), flush=True)
+        upload_scan_results(result)
+        if not result['passed']:
+            sys.exit(1)
+        return
     
-    print(f"{Colors.BOLD}Discovering compliance documents...{Colors.RESET}\n")
+    print_header()
     
-    files_to_check = [
-        ('RISK_REGISTER.yaml', validate_risk_register),
-        ('DATA_CARD.md', validate_data_card),
-        ('MODEL_CARD.md', validate_model_card),
-        ('HUMAN_OVERSIGHT.md', validate_human_oversight),
-        ('INSTRUCTIONS.md', validate_instructions),
-    ]
+    print(f"\n{Colors.DIM}Validating license...{Colors.RESET}", end=" ")
+    pause(0.5)
+    print(f"{Colors.GREEN}✓ Licensed to Demo Partner LLP → Acme Corp{Colors.RESET}")
+    print(f"{Colors.DIM}License valid until: 2027-01-29{Colors.RESET}\n")
     
-    found_files = []
-    for filename, validator in files_to_check:
-        filepath = compliance_dir / filename
-        if filepath.exists():
-            size = filepath.stat().st_size / 1024
-            print(f"  {Colors.DIM}├─{Colors.RESET} {filename} {Colors.DIM}({size:.1f} KB){Colors.RESET}")
-            found_files.append((filename, validator, filepath))
-            time.sleep(0.1)
+    result = run_scan('.', jobs=args.jobs, use_cache=not args.no_cache)
+    all_errors = result['errors']
+    all_warnings = result['warnings']
+    
+    print(f"{Colors.BOLD}Discovering compliance documents...{Colors.RESET}\n")
+    
+    sizes = {doc['name']: doc['size'] for doc in result['documents']}
+    for filename in COMPLIANCE_DOCUMENTS:
+        if filename in sizes:
+            print(f"  {Colors.DIM}├─{Colors.RESET} {filename} {Colors.DIM}({sizes[filename] / 1024:.1f} KB){Colors.RESET}")
+            pause(0.1)
         else:
             print(f"  {Colors.DIM}├─{Colors.RESET} {Colors.RED}{filename} (missing){Colors.RESET}")
-            all_errors.append(f'{filename}: File missing')
     
     print(f"\n{Colors.DIM}Scanning source files for security patterns...{Colors.RESET}")
-    src_errors, src_warnings = scan_source_files()
-    all_errors.extend(src_errors)
-    all_warnings.extend(src_warnings)
-    time.sleep(0.3)
+    pause(0.3)
     
     print(f"\n{Colors.BOLD}Running compliance checks...{Colors.RESET}\n")
-    time.sleep(0.3)
-    
-    # Validate each file
-    for filename, validator, filepath in found_files:
-        content = filepath.read_text()
-        errors, warnings = validator(content)
-        all_errors.extend(errors)
-        all_warnings.extend(warnings)
-    
-    # Group by article
-    articles = {
-        'Article 9': [],
-        'Article 10': [],
-        'Article 13': [],
-        'Article 14': [],
-        'Article 15': [],
-    }
-    
-    for err in all_errors:
-        if 'RISK_REGISTER' in err:
-            articles['Article 9'].append(('error', err))
-        elif 'DATA_CARD' in err:
-            articles['Article 10'].append(('error', err))
-        elif 'MODEL_CARD' in err or 'INSTRUCTIONS' in err:
-            articles['Article 13'].append(('error', err))
-        elif 'HUMAN_OVERSIGHT' in err:
-            articles['Article 14'].append(('error', err))
-        elif 'Article 15' in err or 'pickle' in err.lower() or 'security' in err.lower():
-            articles['Article 15'].append(('error', err))
-    
-    for warn in all_warnings:
-        if 'RISK_REGISTER' in warn:
-            articles['Article 9'].append(('warning', warn))
-        elif 'DATA_CARD' in warn:
-            articles['Article 10'].append(('warning', warn))
-        elif 'MODEL_CARD' in warn or 'INSTRUCTIONS' in warn:
-            articles['Article 13'].append(('warning', warn))
-        elif 'HUMAN_OVERSIGHT' in warn:
-            articles['Article 14'].append(('warning', warn))
-        elif 'security' in warn.lower():
-            articles['Article 15'].append(('warning', warn))
+    pause(0.3)
     
     # Print results by article
-    for article, items in articles.items():
-        print(f"{Colors.BOLD}━━━ {article}: {'Risk Management' if '9' in article else 'Data Governance' if '10' in article else 'Transparency' if '13' in article else 'Human Oversight' if '14' in article else 'Accuracy, Robustness, Security'} ━━━{Colors.RESET}")
-        
-        errors_in_article = [i for i in items if i[0] == 'error']
-        warnings_in_article = [i for i in items if i[0] == 'warning']
+    for article, items in result['articles'].items():
+        print(f"{Colors.BOLD}━━━ {article}: {ARTICLE_TITLES.get(article, '')} ━━━{Colors.RESET}")
         
         if not items:
             print(f"  {Colors.GREEN}✓{Colors.RESET} All checks passed")
         else:
-            for item_type, message in items:
-                if item_type == 'error':
-                    print(f"  {Colors.RED}✗{Colors.RESET} {Colors.RED}{message}{Colors.RESET}")
+            for finding in items:
+                if finding.severity == 'error':
+                    print(f"  {Colors.RED}✗{Colors.RESET} {Colors.RED}{finding}{Colors.RESET}")
                 else:
-                    print(f"  {Colors.YELLOW}⚠{Colors.RESET} {Colors.YELLOW}{message}{Colors.RESET}")
+                    print(f"  {Colors.YELLOW}⚠{Colors.RESET} {Colors.YELLOW}{finding}{Colors.RESET}")
         
         print()
-        time.sleep(0.2)
+        pause(0.2)
     
     # Summary
-    passed = len(all_errors) == 0
+    passed = result['passed']
     
     if passed:
         print(f"""
@@ -526,26 +1135,14 @@ def cmd_scan(args):
         
         # Calculate hashes
         print(f"  {Colors.CYAN}Documents sent:{Colors.RESET}")
-        for filename, _, filepath in found_files:
-            content = filepath.read_text()
-            hash_val = hashlib.sha256(content.encode()).hexdigest()[:12]
-            print(f"    ├─ {filename} → sha256:{hash_val}...")
+        for doc in result['documents']:
+            print(f"    ├─ {doc['name']} → sha256:{doc['sha256'][:12]}...")
         
         print(f"\n  {Colors.CYAN}Notifying CRO...{Colors.RESET}")
-        time.sleep(0.3)
+        pause(0.3)
         
         # Send to API
-        scan_results = {
-            'errors': all_errors,
-            'warnings': all_warnings,
-            'documents': [f[0] for f in found_files],
-            'passed': True,
-        }
-        
-        result = api_call('POST', '/api/scan', {
-            'systemId': SYSTEM_ID,
-            'results': scan_results,
-        })
+        upload_scan_results(result)
         
         print(f"    {Colors.GREEN}✓{Colors.RESET} Results synced to platform")
         print(f"    {Colors.GREEN}✓{Colors.RESET} CRO notified: m.silva@acme.com")
@@ -579,27 +1176,129 @@ def cmd_scan(args):
 """)
         
         # Still send to API (failed scan)
-        scan_results = {
-            'errors': all_errors,
-            'warnings': all_warnings,
-            'documents': [f[0] for f in found_files],
-            'passed': False,
-        }
-        
-        api_call('POST', '/api/scan', {
-            'systemId': SYSTEM_ID,
-            'results': scan_results,
-        })
+        upload_scan_results(result)
         
         sys.exit(1)
 
+# ============================================
+# BULK-SCAN Command
+# ============================================
+
+SYSTEM_CONFIG = 'annexci.yaml'
+_CONFIG_SYSTEM_ID = re.compile(r'^system:[ \t]*\n(?:[ \t]+.*\n|[ \t]*\n)*?[ \t]+id:[ \t]*["\']?([^\s"\'#]+)', re.MULTILINE)
+
+def discover_systems(root='.'):
+    """Directories under root that hold an annexci.yaml; systems are not nested"""
+    systems = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if SYSTEM_CONFIG in filenames:
+            systems.append(os.path.normpath(dirpath))
+            dirnames[:] = []
+        else:
+            dirnames[:] = sorted(d for d in dirnames if d not in SCAN_EXCLUDE_DIRS)
+    return systems
+
+def read_system_id(system_dir):
+    """system.id from a system's annexci.yaml, or the directory name if unset"""
+    try:
+        with open(os.path.join(system_dir, SYSTEM_CONFIG)) as f:
+            match = _CONFIG_SYSTEM_ID.search(f.read())
+    except OSError:
+        match = None
+    return match.group(1) if match else os.path.basename(os.path.abspath(system_dir))
+
+def _scan_system(system_dir, use_cache):
+    # Runs in a worker process; one process per system, so the source scan is serial
+    return read_system_id(system_dir), run_scan(system_dir, jobs=1, use_cache=use_cache)
+
+def scan_systems(system_dirs, jobs=None, use_cache=True):
+    """Scan many systems concurrently; returns [(system_dir, system_id, result)] in input order"""
+    if len(system_dirs) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            scanned = list(pool.map(_scan_system, system_dirs, [use_cache] * len(system_dirs)))
+    else:
+        scanned = [_scan_system(d, use_cache) for d in system_dirs]
+    return [(d, system_id, result) for d, (system_id, result) in zip(system_dirs, scanned)]
+
+def upload_bulk_results(scans, batch_size=50, client=None):
+    """
+    Upload (system_id, result) pairs in batches to /api/scan/bulk.
+    
+    Falls back to concurrent single /api/scan requests on the pooled
+    client when the platform has no bulk endpoint.
+    """
+    client = client or get_client()
+    payloads = [scan_payload(result, system_id) for system_id, result in scans]
+    for start in range(0, len(payloads), batch_size):
+        batch = payloads[start:start + batch_size]
+        if client.post('/api/scan/bulk', {'scans': batch}, missing_ok=True) is None:
+            break
+    else:
+        return
+    
+    remaining = payloads[start:]
+    with ThreadPoolExecutor(max_workers=min(16, len(remaining))) as pool:
+        list(pool.map(lambda payload: client.post('/api/scan', payload), remaining))
+
+def cmd_bulk_scan(args):
+    """Scan every system under a directory and upload all results"""
+    started = time.perf_counter()
+    system_dirs = discover_systems(args.root)
+    if not system_dirs:
+        raise AnnexCIError(f"No {SYSTEM_CONFIG} found under {args.root}",
+                           hint=f"Run {Colors.CYAN}annexci init{Colors.RESET} in each system directory first.")
+    
+    scanned = scan_systems(system_dirs, jobs=args.jobs, use_cache=not args.no_cache)
+    if not args.no_upload:
+        upload_bulk_results([(system_id, result) for _, system_id, result in scanned], args.batch_size)
+    failed = sum(not result['passed'] for _, _, result in scanned)
+    elapsed = time.perf_counter() - started
+    
+    if not INTERACTIVE:
+        print(json.dumps({
+            'passed': failed == 0,
+            'systems': {
+                system_dir: dict(scan_report(result), systemId=system_id)
+                for system_dir, system_id, result in scanned
+            },
+            'failed': failed,
+            'elapsed_s': round(elapsed, 3),
+        }, indent=2))
+    else:
+        print(f"\n{Colors.BOLD}{'System':<20} {'Path':<32} {'Errors':>6} {'Warnings':>8}  Result{Colors.RESET}")
+        for system_dir, system_id, result in scanned:
+            status = f"{Colors.GREEN}PASSED{Colors.RESET}" if result['passed'] else f"{Colors.RED}FAILED{Colors.RESET}"
+            print(f"{system_id:<20} {system_dir:<32} {len(result['errors']):>6} {len(result['warnings']):>8}  {status}")
+        print(f"\n{len(scanned)} systems scanned in {elapsed:.2f}s, {failed} failed"
+              f"{'' if args.no_upload else ', results synced to platform'}\n")
+    
+    if failed:
+        sys.exit(1)
+
 # ============================================
 # DEPLOY Command
 # ============================================
 
+def block_deployment(reason):
+    """Report a refused deployment (JSON in CI mode) and exit 1"""
+    if not INTERACTIVE:
+        print(json.dumps({'authorized': False, 'reason': reason}))
+        sys.exit(1)
+    print(f"""
+{Colors.RED}{Colors.BOLD}╔═══════════════════════════════════════════════════════════════╗
+║                                                               ║
+║   ✗ DEPLOYMENT BLOCKED                                        ║
+║                                                               ║
+║   Reason: {reason:<50} ║
+║                                                               ║
+╚═══════════════════════════════════════════════════════════════╝{Colors.RESET}
+""")
+    sys.exit(1)
+
 def cmd_deploy(args):
     """Deploy with compliance token"""
-    print(f"""
+    if INTERACTIVE:
+        print(f"""
 {Colors.CYAN}{Colors.BOLD}
     ╔═══════════════════════════════════════════════════════════════╗
     ║                     ANNEXCI DEPLOYMENT GATE                   ║
@@ -613,52 +1312,60 @@ def cmd_deploy(args):
     
     token_id = args.token
     
-    print(f"{Colors.DIM}Verifying compliance token...{Colors.RESET}\n")
-    time.sleep(0.5)
+    if INTERACTIVE:
+        print(f"{Colors.DIM}Verifying compliance token...{Colors.RESET}\n")
+    pause(0.5)
     
     # Step 1: Validate token
     print_step("Decrypting token payload", 'running')
-    time.sleep(0.4)
+    pause(0.4)
     print_step("Decrypting token payload", 'done')
     
     print_step("Validating token signature", 'running')
-    time.sleep(0.4)
+    pause(0.4)
     
     validation = api_call('POST', '/api/token/validate', {'tokenId': token_id})
     
     if not validation.get('valid'):
         print_step("Validating token signature", 'fail')
-        print(f"""
-{Colors.RED}{Colors.BOLD}╔═══════════════════════════════════════════════════════════════╗
-║                                                               ║
-║   ✗ DEPLOYMENT BLOCKED                                        ║
-║                                                               ║
-║   Reason: {validation.get('reason', 'Invalid token'):<50} ║
-║                                                               ║
-╚═══════════════════════════════════════════════════════════════╝{Colors.RESET}
-""")
-        sys.exit(1)
+        block_deployment(validation.get('reason', 'Invalid token'))
     
     print_step("Validating token signature", 'done')
     
     token = validation['token']
     
     print_step(f"Checking issuer: {token['issuedBy']}", 'running')
-    time.sleep(0.3)
+    pause(0.3)
     print_step(f"Checking issuer: {token['issuedBy']}", 'done')
     
-    print_step("Verifying model hash", 'running')
-    time.sleep(0.3)
-    print(f"\r  {Colors.GREEN}✓{Colors.RESET} Verifying model hash: {token['modelHash'][:20]}...    ")
+    # Fail closed: an unverifiable model blocks the deployment unless the
+    # check is explicitly skipped, which the result then records
+    model_verified = False
+    if args.skip_model_check:
+        notice(f"{Colors.YELLOW}Warning: --skip-model-check given; model hash not verified.{Colors.RESET}")
+    else:
+        print_step("Verifying model hash", 'running')
+        pause(0.3)
+        manifest = HashManifest()
+        local_hash = manifest.digest(args.model)
+        manifest.save()
+        expected = token['modelHash'].lower().removeprefix('sha256:')
+        if local_hash is None:
+            print_step("Verifying model hash", 'fail')
+            block_deployment(f"Model not found: {args.model}")
+        if local_hash != expected:
+            print_step("Verifying model hash", 'fail')
+            block_deployment(f"Model hash mismatch: local {local_hash[:12]}, token {expected[:12]}")
+        print_step(f"Verifying model hash: {token['modelHash'][:20]}...", 'done')
+        model_verified = True
     
     print_step("Checking attestations", 'running')
-    time.sleep(0.3)
+    pause(0.3)
     print_step(f"Checking attestations ({len(token['attestations'])} on file)", 'done')
     
-    print()
-    
     # Step 2: Create token file for GitHub Actions
-    print(f"{Colors.BOLD}Authorizing deployment...{Colors.RESET}\n")
+    if INTERACTIVE:
+        print(f"\n{Colors.BOLD}Authorizing deployment...{Colors.RESET}\n")
     
     # Create .annexci directory if it doesn't exist
     annexci_dir = Path('.annexci')
@@ -667,7 +1374,7 @@ def cmd_deploy(args):
     # Write token file
     token_file = annexci_dir / 'token'
     print_step("Writing compliance token to .annexci/token", 'running')
-    time.sleep(0.3)
+    pause(0.3)
     with open(token_file, 'w') as f:
         f.write(token_id)
     print_step("Writing compliance token to .annexci/token", 'done')
@@ -676,16 +1383,16 @@ def cmd_deploy(args):
     import subprocess
     
     print_step("Staging token file", 'running')
-    time.sleep(0.3)
+    pause(0.3)
     try:
         subprocess.run(['git', 'add', '.annexci/token'], check=True, capture_output=True)
         print_step("Staging token file", 'done')
     except subprocess.CalledProcessError:
         print_step("Staging token file", 'fail')
-        print(f"{Colors.YELLOW}Warning: Could not stage file. Run 'git add .annexci/token' manually.{Colors.RESET}")
+        notice(f"{Colors.YELLOW}Warning: Could not stage file. Run 'git add .annexci/token' manually.{Colors.RESET}")
     
     print_step("Committing authorization", 'running')
-    time.sleep(0.3)
+    pause(0.3)
     try:
         subprocess.run([
             'git', 'commit', '-m', 
@@ -700,19 +1407,19 @@ def cmd_deploy(args):
             print_step("Committing authorization (already committed)", 'done')
         else:
             print_step("Committing authorization", 'fail')
-            print(f"{Colors.YELLOW}Warning: Could not commit. Run 'git commit' manually.{Colors.RESET}")
+            notice(f"{Colors.YELLOW}Warning: Could not commit. Run 'git commit' manually.{Colors.RESET}")
     
     print_step("Pushing to remote", 'running')
-    time.sleep(0.5)
+    pause(0.5)
     try:
         subprocess.run(['git', 'push'], check=True, capture_output=True)
         print_step("Pushing to remote", 'done')
     except subprocess.CalledProcessError:
         print_step("Pushing to remote", 'fail')
-        print(f"{Colors.YELLOW}Warning: Could not push. Run 'git push' manually.{Colors.RESET}")
+        notice(f"{Colors.YELLOW}Warning: Could not push. Run 'git push' manually.{Colors.RESET}")
     
     print_step("Enabling Article 12 logging", 'running')
-    time.sleep(0.3)
+    pause(0.3)
     print_step("Enabling Article 12 logging", 'done')
     
     # Record deployment in API
@@ -722,9 +1429,22 @@ def cmd_deploy(args):
     })
     
     print_step("Registering in audit trail", 'running')
-    time.sleep(0.3)
+    pause(0.3)
     print_step("Registering in audit trail", 'done')
     
+    if not INTERACTIVE:
+        print(json.dumps({
+            'authorized': True,
+            'systemId': token['systemId'],
+            'systemName': token['systemName'],
+            'systemVersion': token['systemVersion'],
+            'token': token_id,
+            'issuedBy': token['issuedBy'],
+            'modelHash': token['modelHash'],
+            'modelVerified': model_verified,
+        }))
+        return
+    
     print(f"""
 {Colors.GREEN}{Colors.BOLD}╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
@@ -765,32 +1485,65 @@ Examples:
   annexci init              Initialize compliance structure
   annexci scan              Run compliance scan
   annexci deploy --token X  Deploy with compliance token
+  annexci scan --ci         Scan without animations; JSON report on stdout
+  annexci bulk-scan systems/  Scan and sync every system under systems/
         '''
     )
     
+    # Output mode, accepted before or after the command
+    mode = argparse.ArgumentParser(add_help=False)
+    mode_group = mode.add_mutually_exclusive_group()
+    mode_group.add_argument('--ci', dest='interactive', action='store_false', default=argparse.SUPPRESS,
+                            help='Non-interactive: no animations or banners, JSON output (default when stdout is not a TTY)')
+    mode_group.add_argument('--interactive', dest='interactive', action='store_true', default=argparse.SUPPRESS,
+                            help='Force interactive output')
+    parser.add_argument('--ci', dest='interactive', action='store_false', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--interactive', dest='interactive', action='store_true', default=None, help=argparse.SUPPRESS)
+    
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
     
     # init command
-    init_parser = subparsers.add_parser('init', help='Initialize compliance structure')
+    init_parser = subparsers.add_parser('init', parents=[mode], help='Initialize compliance structure')
     init_parser.add_argument('--force', action='store_true', help='Overwrite existing files')
     
     # scan command
-    scan_parser = subparsers.add_parser('scan', help='Run compliance scan')
+    scan_parser = subparsers.add_parser('scan', parents=[mode], help='Run compliance scan')
+    scan_parser.add_argument('--jobs', type=int, default=None, help='Worker processes for the source scan (default: CPU count)')
+    scan_parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update .annexci/cache')
+    
+    # bulk-scan command
+    bulk_parser = subparsers.add_parser('bulk-scan', parents=[mode], help='Scan every system (annexci.yaml) under a directory')
+    bulk_parser.add_argument('root', nargs='?', default='.', help='Directory to search for systems (default: .)')
+    bulk_parser.add_argument('--jobs', type=int, default=None, help='Systems scanned in parallel (default: CPU count)')
+    bulk_parser.add_argument('--batch-size', type=int, default=50, help='Scan results per upload request')
+    bulk_parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update .annexci/cache')
+    bulk_parser.add_argument('--no-upload', action='store_true', help='Scan only; do not sync results to the platform')
     
     # deploy command
-    deploy_parser = subparsers.add_parser('deploy', help='Deploy with compliance token')
+    deploy_parser = subparsers.add_parser('deploy', parents=[mode], help='Deploy with compliance token')
     deploy_parser.add_argument('--token', required=True, help='Compliance token')
+    deploy_parser.add_argument('--model', default=str(MODEL_PATH), help=f'Model weights checked against the token (default: {MODEL_PATH})')
+    deploy_parser.add_argument('--skip-model-check', action='store_true', help='Deploy without verifying the model hash (recorded as modelVerified: false)')
     
     args = parser.parse_args()
+    set_interactive(sys.stdout.isatty() if args.interactive is None else args.interactive)
     
-    if args.command == 'init':
-        cmd_init(args)
-    elif args.command == 'scan':
-        cmd_scan(args)
-    elif args.command == 'deploy':
-        cmd_deploy(args)
-    else:
-        parser.print_help()
+    try:
+        if args.command == 'init':
+            cmd_init(args)
+        elif args.command == 'scan':
+            cmd_scan(args)
+        elif args.command == 'bulk-scan':
+            cmd_bulk_scan(args)
+        elif args.command == 'deploy':
+            cmd_deploy(args)
+        else:
+            parser.print_help()
+    except AnnexCIError as e:
+        notice(f"\n{Colors.RED}Error: {e}{Colors.RESET}")
+        if e.hint:
+            notice(f"{Colors.DIM}{e.hint}{Colors.RESET}")
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
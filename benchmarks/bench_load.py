@@ -0,0 +1,143 @@
+"""
+Benchmark: eager vs memory-mapped (lazy) weight loading.
+
+Each mode is measured in fresh subprocesses so memory numbers are not
+polluted by the previous run. Memory is reported as proportional set size
+(Pss), which splits each shared page between the processes mapping it, so
+the totals show memory actually saved by sharing the page cache. All
+workers of a mode are kept alive while each one measures. Usage:
+
+    python benchmarks/bench_load.py --size-mb 512 --workers 4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+def pss_mb() -> float:
+    """Current proportional set size of this process in MB (Linux only)."""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) / 1024
+    except FileNotFoundError:
+        pass
+    return float("nan")
+
+
+def barrier():
+    """Wait until the parent has seen every worker reach this point."""
+    print("ready", flush=True)
+    sys.stdin.readline()
+
+
+def release(procs: list):
+    """Parent side of barrier(): let the workers go once all are waiting."""
+    for p in procs:
+        p.stdout.readline()
+    for p in procs:
+        p.stdin.write("\n")
+        p.stdin.flush()
+
+
+def make_weights(path: str, size_mb: int, n_tensors: int = 16):
+    """Write a synthetic safetensors file of roughly size_mb megabytes."""
+    import numpy as np
+    from model import CreditScoringModel
+
+    per_tensor = size_mb * 1024 * 1024 // 8 // n_tensors
+    rng = np.random.default_rng(0)
+    model = CreditScoringModel(path)
+    model.weights = {f"layer_{i}.weight": rng.standard_normal(per_tensor) for i in range(n_tensors)}
+    model.save_model()
+
+
+def measure(path: str, lazy: bool) -> dict:
+    """Load once and report load time and Pss; run inside a subprocess."""
+    from model import CreditScoringModel
+
+    barrier()
+    before = pss_mb()
+    start = time.perf_counter()
+    model = CreditScoringModel(path).load_model(lazy=lazy)
+    load_s = time.perf_counter() - start
+    barrier()
+    after_load = pss_mb()
+
+    # Touch one tensor to show the cost of first access
+    start = time.perf_counter()
+    float(model.weights["layer_0.weight"].sum())
+    first_access_s = time.perf_counter() - start
+    barrier()
+    after_access = pss_mb()
+    barrier()  # nobody exits, unmapping shared pages, until all have measured
+
+    return {
+        "mode": "lazy" if lazy else "eager",
+        "load_ms": round(load_s * 1000, 3),
+        "first_access_ms": round(first_access_s * 1000, 3),
+        "pss_delta_mb": round(after_load - before, 1),
+        "pss_after_access_mb": round(after_access - before, 1),
+    }
+
+
+def run_mode(path: str, lazy: bool, workers: int) -> list:
+    cmd = [sys.executable, __file__, "--measure", path] + (["--lazy"] if lazy else [])
+    procs = [subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+             for _ in range(workers)]
+    for _ in range(4):  # the barriers in measure()
+        release(procs)
+    return [json.loads(p.communicate()[0]) for p in procs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=256, help="Size of the synthetic weights file")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent loader processes per mode")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--measure", metavar="PATH", help=argparse.SUPPRESS)
+    parser.add_argument("--lazy", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.lazy)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench_model.safetensors")
+        make_weights(path, args.size_mb)
+
+        results = []
+        for lazy in (False, True):
+            runs = run_mode(path, lazy, args.workers)
+            results.append({
+                "mode": runs[0]["mode"],
+                "workers": args.workers,
+                "load_ms_mean": round(sum(r["load_ms"] for r in runs) / len(runs), 3),
+                "first_access_ms_mean": round(sum(r["first_access_ms"] for r in runs) / len(runs), 3),
+                "pss_mb_total": round(sum(r["pss_delta_mb"] for r in runs), 1),
+                "pss_after_access_mb_total": round(sum(r["pss_after_access_mb"] for r in runs), 1),
+            })
+
+    print(f"{'mode':<6} {'load ms':>10} {'1st access ms':>14} {'PSS MB':>10} {'PSS MB (touched)':>17}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['load_ms_mean']:>10} {r['first_access_ms_mean']:>14} "
+              f"{r['pss_mb_total']:>10} {r['pss_after_access_mb_total']:>17}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"size_mb": args.size_mb, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: rows/second scaling of ParallelScorer from 1 to N worker processes.
+
+    python benchmarks/bench_parallel.py --rows 1000000 --max-workers 8
+"""
+
+import argparse
+import json
+import os
+import time
+
+from common import synthetic_batch
+
+from parallel import ParallelScorer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000, help="Applications scored per run")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Rows per task sent to a worker")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="Largest pool size to try")
+    parser.add_argument("--model", help="Path to safetensors weights (default: unloaded demo model)")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    batch = synthetic_batch(args.rows)
+    results = []
+    # Powers of two, plus max_workers itself so the requested pool size is always measured
+    steps = [1 << i for i in range(max(args.max_workers, 1).bit_length())]
+    if steps[-1] != args.max_workers and args.max_workers > 1:
+        steps.append(args.max_workers)
+    for workers in steps:
+        with ParallelScorer(args.model, workers) as scorer:
+            # Warm up with one chunk per worker, not only the first one to start
+            scorer.score(batch[:args.chunk_size * workers], args.chunk_size)
+            start = time.perf_counter()
+            scorer.score(batch, args.chunk_size)
+            elapsed = time.perf_counter() - start
+        results.append({"workers": workers, "seconds": round(elapsed, 3),
+                        "rows_per_second": round(args.rows / elapsed)})
+
+    base = results[0]["rows_per_second"]
+    print(f"{'workers':>7} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+    for r in results:
+        r["speedup"] = round(r["rows_per_second"] / base, 2)
+        print(f"{r['workers']:>7} {r['seconds']:>9} {r['rows_per_second']:>12} {r['speedup']:>8}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"rows": args.rows, "chunk_size": args.chunk_size, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark suite for the CreditScoringModel hot path.
+
+Times load_model, preprocess, _aggregate_transactions, predict and
+_generate_explanation at each batch size (size 1 uses the single-dict API,
+larger sizes the batch API on synthetic applications), writes the results
+as JSON, and optionally fails when they regress against a saved baseline.
+
+    # Record a baseline
+    python benchmarks/bench_scoring.py --output benchmarks/baseline.json
+
+    # Compare against it; exits 1 if any median latency is >20% slower
+    python benchmarks/bench_scoring.py --baseline benchmarks/baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from common import synthetic_batch
+
+from bench_load import make_weights
+from model import CreditScoringModel
+
+DEFAULT_SIZES = "1,100,10000,1000000"
+BALANCE_MONTHS = 12
+
+
+def time_call(fn, min_time: float, min_repeats: int = 3) -> list:
+    """Call fn until both min_time seconds and min_repeats calls have elapsed."""
+    fn()  # warm-up
+    timings = []
+    deadline = time.perf_counter() + min_time
+    while len(timings) < min_repeats or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+        if timings[-1] > min_time:
+            break
+    return timings
+
+
+def hot_path_cases(model: CreditScoringModel, n: int) -> dict:
+    """Benchmark name -> zero-argument callable scoring n applications."""
+    batch = synthetic_batch(n, balance_months=BALANCE_MONTHS)
+    if n == 1:
+        features = batch[0].to_dict()
+        features["transaction_history"]["monthly_balances"] = batch.balances[0]
+        return {
+            "preprocess": lambda: model.preprocess(features),
+            "aggregate_transactions": lambda: model._aggregate_transactions(features["transaction_history"]),
+            "predict": lambda: model.predict(features),
+            "generate_explanation": lambda: model._generate_explanation(features),
+        }
+    return {
+        "preprocess": lambda: model.preprocess_batch(batch),
+        "aggregate_transactions": lambda: model._aggregate_batch(batch),
+        "predict": lambda: model.predict_batch(batch),
+        "generate_explanation": lambda: model.explain_batch(batch).top_k(3),
+    }
+
+
+def run(sizes, min_time: float, weights_mb: int) -> dict:
+    results = {}
+
+    def record(name, n, timings):
+        median = statistics.median(timings)
+        results[f"{name}[{n}]"] = {
+            "benchmark": name,
+            "batch_size": n,
+            "repeats": len(timings),
+            "median_s": median,
+            "min_s": min(timings),
+            "rows_per_s": n / median if median else float("inf"),
+        }
+        print(f"  {name + f'[{n}]':<36} {median * 1e3:>12.4f} ms {n / median:>16,.0f} rows/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench_model.safetensors")
+        make_weights(path, weights_mb)
+        for lazy in (False, True):
+            name = "load_model_lazy" if lazy else "load_model"
+            record(name, 1, time_call(lambda: CreditScoringModel(path).load_model(lazy=lazy), min_time))
+
+    model = CreditScoringModel(seed=0)
+    for n in sizes:
+        for name, fn in hot_path_cases(model, n).items():
+            record(name, n, time_call(fn, min_time))
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Benchmarks whose median latency grew by more than threshold."""
+    regressions = []
+    for key, base in baseline.items():
+        now = current.get(key)
+        if now is None:
+            continue
+        ratio = now["median_s"] / base["median_s"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{key}: {base['median_s'] * 1e3:.4f} ms -> {now['median_s'] * 1e3:.4f} ms "
+                               f"({(ratio - 1) * 100:+.1f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated batch sizes")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum seconds spent per benchmark")
+    parser.add_argument("--weights-mb", type=int, default=64, help="Size of the synthetic weights file")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown vs baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    print(f"Benchmarking batch sizes {sizes} (python {platform.python_version()})")
+    results = run(sizes, args.min_time, args.weights_mb)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Shared helpers for the benchmark scripts."""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import numpy as np  # noqa: E402
+
+from application import APPLICATION_DTYPE, ApplicationBatch  # noqa: E402
+from transactions import TransactionSeries  # noqa: E402
+
+
+def synthetic_batch(n: int, seed: int = 0, balance_months: int = 0) -> ApplicationBatch:
+    """
+    Random applications following the schema of the src/model.py example.
+
+    Values are drawn around the example application (income 75k, 36 months
+    employed, 84 months of credit history, 15k debt, 25k requested, 5k
+    average monthly balance) and clipped to the model's intended range.
+    """
+    rng = np.random.default_rng(seed)
+    records = np.empty(n, dtype=APPLICATION_DTYPE)
+    records["income_annual"] = rng.lognormal(np.log(75_000), 0.4, n)
+    records["employment_length_months"] = rng.integers(0, 480, n)
+    records["credit_history_length_months"] = rng.integers(0, 600, n)
+    records["existing_debt"] = rng.gamma(2.0, 7_500, n)
+    records["requested_amount"] = rng.uniform(1_000, 50_000, n)
+    records["avg_monthly_balance"] = rng.normal(5_000, 2_000, n).clip(0)
+    balances = None
+    if balance_months:
+        values = rng.normal(records["avg_monthly_balance"][:, None], 500, (n, balance_months))
+        offsets = np.arange(n + 1, dtype=np.int64) * balance_months
+        balances = TransactionSeries(values.reshape(-1), offsets)
+    return ApplicationBatch(records, balances)
+
+
+def synthetic_dicts(n: int, seed: int = 0) -> list:
+    """Same as synthetic_batch, in the legacy dict format accepted by predict()."""
+    return [application.to_dict() for application in synthetic_batch(n, seed)]
@@ -0,0 +1,171 @@
+"""
+Compact application records for CreditScoringModel.
+
+Application is a __slots__ record for a single applicant; ApplicationBatch
+wraps a structured NumPy array (APPLICATION_DTYPE, 40 bytes per row) so an
+ingestion layer can hand over a whole buffer without building dicts.
+"""
+
+import numpy as np
+
+from transactions import TransactionSeries
+
+# Article 13 inputs, in record order
+APPLICATION_DTYPE = np.dtype([
+    ("income_annual", "<f8"),
+    ("employment_length_months", "<i4"),
+    ("credit_history_length_months", "<i4"),
+    ("existing_debt", "<f8"),
+    ("requested_amount", "<f8"),
+    ("avg_monthly_balance", "<f8"),
+])
+APPLICATION_FIELDS = APPLICATION_DTYPE.names
+
+
+class Application:
+    """Single loan application with fixed, typed fields."""
+
+    __slots__ = APPLICATION_FIELDS
+
+    def __init__(
+        self,
+        income_annual: float,
+        employment_length_months: int,
+        credit_history_length_months: int,
+        existing_debt: float,
+        requested_amount: float,
+        avg_monthly_balance: float = 0.0,
+    ):
+        self.income_annual = income_annual
+        self.employment_length_months = employment_length_months
+        self.credit_history_length_months = credit_history_length_months
+        self.existing_debt = existing_debt
+        self.requested_amount = requested_amount
+        self.avg_monthly_balance = avg_monthly_balance
+
+    @classmethod
+    def from_dict(cls, features: dict) -> "Application":
+        """Adapter for the legacy dict format used by predict()."""
+        return cls(*_record_from_dict(features))
+
+    def to_dict(self) -> dict:
+        features = {name: getattr(self, name) for name in APPLICATION_FIELDS[:-1]}
+        features["transaction_history"] = {"avg_monthly_balance": self.avg_monthly_balance}
+        return features
+
+    def as_record(self) -> tuple:
+        return tuple(getattr(self, name) for name in APPLICATION_FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in APPLICATION_FIELDS)
+        return f"Application({fields})"
+
+
+class ApplicationBatch:
+    """
+    Columnar batch of applications backed by one APPLICATION_DTYPE array.
+
+    Columns are exposed as views, and from_buffer() wraps an existing buffer
+    without copying it. Raw monthly balance series, when available, travel
+    alongside as one ragged TransactionSeries buffer.
+    """
+
+    __slots__ = ("records", "balances")
+
+    def __init__(self, records: np.ndarray, balances: TransactionSeries = None):
+        if records.dtype != APPLICATION_DTYPE:
+            raise TypeError(f"expected dtype {APPLICATION_DTYPE}, got {records.dtype}")
+        records = records.reshape(-1)
+        if balances is not None and len(balances) != len(records):
+            raise ValueError(f"balances cover {len(balances)} rows, batch has {len(records)}")
+        self.records = records
+        self.balances = balances
+
+    @classmethod
+    def from_buffer(cls, buffer, balances: TransactionSeries = None) -> "ApplicationBatch":
+        """Zero-copy view over bytes/memoryview/mmap laid out as APPLICATION_DTYPE."""
+        return cls(np.frombuffer(buffer, dtype=APPLICATION_DTYPE), balances)
+
+    @classmethod
+    def from_applications(cls, applications) -> "ApplicationBatch":
+        return cls(np.array([a.as_record() for a in applications], dtype=APPLICATION_DTYPE))
+
+    @classmethod
+    def from_dicts(cls, applications) -> "ApplicationBatch":
+        """
+        Adapter for a sequence of legacy feature dicts (or Application records).
+
+        A raw 'monthly_balances' array inside transaction_history is packed
+        into the batch's TransactionSeries.
+        """
+        records = []
+        balances = []
+        for a in applications:
+            if isinstance(a, Application):
+                records.append(a.as_record())
+                balances.append(None)
+            else:
+                records.append(_record_from_dict(a))
+                balances.append((a.get("transaction_history") or {}).get("monthly_balances"))
+        series = None
+        if any(b is not None for b in balances):
+            series = TransactionSeries.from_sequences(balances)
+        return cls(np.array(records, dtype=APPLICATION_DTYPE), series)
+
+    @classmethod
+    def from_columns(cls, columns: dict) -> "ApplicationBatch":
+        """
+        Build a batch from a dict of equal-length arrays keyed by field name.
+
+        The transaction component may be given either as an
+        'avg_monthly_balance' column or as a 'transaction_history' sequence
+        of dicts; it defaults to zero. Raw series may be passed as
+        'monthly_balances', either a TransactionSeries or one array per row.
+        """
+        n = len(columns[APPLICATION_FIELDS[0]])
+        records = np.zeros(n, dtype=APPLICATION_DTYPE)
+        for name in APPLICATION_FIELDS[:-1]:
+            records[name] = columns[name]
+        if "avg_monthly_balance" in columns:
+            records["avg_monthly_balance"] = columns["avg_monthly_balance"]
+        elif columns.get("transaction_history") is not None:
+            records["avg_monthly_balance"] = [
+                (t or {}).get("avg_monthly_balance", 0) for t in columns["transaction_history"]
+            ]
+        balances = columns.get("monthly_balances")
+        if balances is not None and not isinstance(balances, TransactionSeries):
+            balances = TransactionSeries.from_sequences(balances)
+        return cls(records, balances)
+
+    def take(self, indices) -> "ApplicationBatch":
+        """Rows at the given indices, as a new batch."""
+        balances = self.balances.take(indices) if self.balances is not None else None
+        return ApplicationBatch(self.records[indices], balances)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.records[name]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            balances = self.balances[index] if self.balances is not None else None
+            return ApplicationBatch(self.records[index], balances)
+        return Application(*self.records[index].tolist())
+
+    def __iter__(self):
+        for record in self.records.tolist():
+            yield Application(*record)
+
+
+def _record_from_dict(features: dict) -> tuple:
+    transactions = features.get("transaction_history") or {}
+    return (
+        features["income_annual"],
+        features["employment_length_months"],
+        features["credit_history_length_months"],
+        features["existing_debt"],
+        features["requested_amount"],
+        transactions.get("avg_monthly_balance", 0),
+    )
@@ -0,0 +1,195 @@
+"""
+Article 12 decision log.
+
+Every predict decision is handed to a DecisionLogWriter, which buffers it
+in a bounded queue and lets a background thread write records in bulk to
+append-only, size-rotated segment files, fsyncing once per batch of
+records (or per interval) rather than once per decision.
+
+    log = DecisionLogWriter("logs/decisions")
+    model.decision_log = log
+    ...
+    log.close()
+"""
+
+import json
+import os
+import queue
+import re
+import threading
+import time
+from pathlib import Path
+
+SEGMENT_PATTERN = re.compile(r"^decisions-(\d{8})\.(\w+)$")
+
+_STOP = object()
+_SYNC = object()
+
+
+def _snapshot(result: dict) -> dict:
+    """Copy of a result, including its explanation entries."""
+    return {
+        key: [dict(item) if isinstance(item, dict) else item for item in value] if isinstance(value, list) else value
+        for key, value in result.items()
+    }
+
+
+class DecisionLogWriter:
+    """
+    Background, batched writer of decision records.
+
+    Args:
+        directory: where segment files are created
+        segment_bytes: rotate to a new segment once the current one is this large
+        max_pending: bound on queued log calls; log()/log_many() block when full
+        fsync_every: fsync after this many records...
+        fsync_interval: ...or after this many seconds, whichever comes first
+    """
+
+    extension = "jsonl"
+
+    def __init__(self, directory: str, segment_bytes: int = 64 * 1024 * 1024,
+                 max_pending: int = 10_000, fsync_every: int = 10_000, fsync_interval: float = 1.0):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.records_written = 0
+
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._segment = None
+        self._segment_index = self._last_segment_index()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="decision-log", daemon=True)
+        self._thread.start()
+
+    def log(self, result: dict, input_hash: str = None, timeout: float = None):
+        """Queue one decision; blocks (up to timeout) if the queue is full."""
+        self.log_many([result], [input_hash], timeout)
+
+    def log_many(self, results: list, input_hashes: list = None, timeout: float = None):
+        """
+        Queue a batch of decisions as a single queue entry.
+
+        The results are copied before queueing, so the log records each
+        decision as it was made even if the caller changes it afterwards.
+        """
+        self._raise_error()
+        self._queue.put((time.time(), [_snapshot(r) for r in results], input_hashes), timeout=timeout)
+
+    def flush(self):
+        """
+        Block until every queued decision has been written and fsynced.
+
+        Raises RuntimeError if any write has failed, since those decisions
+        were lost.
+        """
+        self._queue.put(_SYNC)
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Stop the writer thread; raises RuntimeError if any write failed."""
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError("Decision log writer failed") from self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Background thread
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                try:
+                    self._maybe_sync(force=self._unsynced > 0)
+                except Exception as e:
+                    self._error = e
+                continue
+
+            items = [item]
+            while len(items) < 1024:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(i is _STOP for i in items)
+            sync = stop or any(i is _SYNC for i in items)
+            try:
+                self._write([i for i in items if i is not _STOP and i is not _SYNC])
+                self._maybe_sync(force=sync)
+            except Exception as e:  # surfaced to callers on their next log call
+                self._error = e
+            for _ in items:
+                self._queue.task_done()
+            if stop:
+                self._close_segment()
+                return
+
+    def _write(self, items: list):
+        payload = self._encode(items)
+        if not payload:
+            return
+        segment = self._current_segment()
+        segment.write(payload)
+        count = sum(len(results) for _, results, _ in items)
+        self._unsynced += count
+        self.records_written += count
+
+    def _encode(self, items: list) -> bytes:
+        lines = []
+        for ts, results, hashes in items:
+            hashes = hashes if hashes is not None else [None] * len(results)
+            for result, input_hash in zip(results, hashes):
+                record = {"ts": ts, "input_hash": input_hash}
+                record.update(result)
+                lines.append(json.dumps(record, separators=(",", ":")))
+        return ("\n".join(lines) + "\n").encode() if lines else b""
+
+    def _maybe_sync(self, force: bool = False):
+        if self._segment is None:
+            return
+        due = (self._unsynced >= self.fsync_every
+               or time.monotonic() - self._last_sync >= self.fsync_interval)
+        if self._unsynced and (force or due):
+            self._segment.flush()
+            os.fsync(self._segment.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+        if self._segment.tell() >= self.segment_bytes:
+            self._close_segment()
+
+    def _current_segment(self):
+        if self._segment is None:
+            self._segment_index += 1
+            path = self.directory / f"decisions-{self._segment_index:08d}.{self.extension}"
+            # "x": segments are append-only and never reopened or overwritten
+            self._segment = open(path, "xb")
+        return self._segment
+
+    def _close_segment(self):
+        if self._segment is None:
+            return
+        self._segment.flush()
+        os.fsync(self._segment.fileno())
+        self._segment.close()
+        self._segment = None
+        self._unsynced = 0
+
+    def _last_segment_index(self) -> int:
+        indices = [int(m.group(1)) for m in map(SEGMENT_PATTERN.match, os.listdir(self.directory)) if m]
+        return max(indices, default=0)
@@ -0,0 +1,352 @@
+"""
+Binary columnar segments for Article 12 decision logs.
+
+A .dseg segment stores N decisions column by column, each column aligned
+to 8 bytes, little-endian:
+
+    header      "<4sHHQI"  magic b"DSEG", format version, reserved, N,
+                           length of the model_version dictionary
+    dictionary  JSON list of model_version strings
+    ts          int64      microseconds since the epoch
+    score       int16
+    recommendation uint8   index into RECOMMENDATIONS
+    confidence  float32
+    model_version uint16   index into the dictionary
+    requires_human_review uint8
+    input_hash  16 bytes   blake2b-128 digest of the raw feature vector
+
+Segments are opened memory-mapped and columns are zero-copy NumPy views,
+so audit queries over millions of decisions never parse JSON.
+
+While a segment is being filled, ColumnarDecisionLogWriter appends each
+batch to decisions-<n>.journal as a small segment of its own; the journal
+is compacted into decisions-<n>.dseg when the segment is complete.
+
+    python src/decision_store.py logs/decisions --approval-rate
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+
+import numpy as np
+
+from decision_log import DecisionLogWriter
+
+MAGIC = b"DSEG"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHQI")
+RECOMMENDATIONS = ("APPROVE", "REVIEW", "DECLINE")
+_RECOMMENDATION_CODES = {name: code for code, name in enumerate(RECOMMENDATIONS)}
+
+# (name, dtype) in file order
+COLUMNS = (
+    ("ts", np.dtype("<i8")),
+    ("score", np.dtype("<i2")),
+    ("recommendation", np.dtype("u1")),
+    ("confidence", np.dtype("<f4")),
+    ("model_version", np.dtype("<u2")),
+    ("requires_human_review", np.dtype("u1")),
+    ("input_hash", np.dtype("V16")),
+)
+
+US_PER_DAY = 86_400 * 1_000_000
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_segment(path, batches):
+    """
+    Write decisions to a new segment file.
+
+    batches is a sequence of (timestamp, results, input_hashes) as queued
+    by DecisionLogWriter. The file is written under a temporary name,
+    fsynced and renamed, so readers never see a partial segment.
+    """
+    _write_atomic(path, encode_segment(*_batch_columns(batches)))
+
+
+def _batch_columns(batches):
+    """Columns in COLUMNS order plus the model_version dictionary."""
+    n = sum(len(results) for _, results, _ in batches)
+    ts = np.empty(n, dtype="<i8")
+    score = np.empty(n, dtype="<i2")
+    recommendation = np.empty(n, dtype="u1")
+    confidence = np.empty(n, dtype="<f4")
+    model_version = np.empty(n, dtype="<u2")
+    review = np.empty(n, dtype="u1")
+    input_hash = np.zeros(n, dtype="V16")
+
+    versions = {}
+    i = 0
+    for timestamp, results, hashes in batches:
+        j = i + len(results)
+        ts[i:j] = int(timestamp * 1_000_000)
+        score[i:j] = [r["score"] for r in results]
+        recommendation[i:j] = [_RECOMMENDATION_CODES[r["recommendation"]] for r in results]
+        confidence[i:j] = [r["confidence"] for r in results]
+        model_version[i:j] = [versions.setdefault(r["model_version"], len(versions)) for r in results]
+        review[i:j] = [r["requires_human_review"] for r in results]
+        if hashes is not None:
+            input_hash[i:j] = [bytes.fromhex(h) if h else bytes(16) for h in hashes]
+        i = j
+    return (ts, score, recommendation, confidence, model_version, review, input_hash), list(versions)
+
+
+def encode_segment(columns, versions: list) -> bytes:
+    """Serialize columns (in COLUMNS order) as one segment."""
+    dictionary = json.dumps(versions).encode()
+    parts = [HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(columns[0]), len(dictionary)), dictionary]
+    offset = HEADER.size + len(dictionary)
+    for column in columns:
+        padding = _align(offset) - offset
+        parts += [bytes(padding), column.tobytes()]
+        offset += padding + column.nbytes
+    return b"".join(parts)
+
+
+def _write_atomic(path, data: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.rename(tmp_path, path)
+
+
+def _parse_segment(buffer, offset: int = 0):
+    """(versions, {column: view}, end offset) of the segment starting at offset."""
+    magic, version, _, n, dict_len = HEADER.unpack_from(buffer, offset)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a decision segment (format {version})")
+    offset += HEADER.size
+    versions = json.loads(bytes(buffer[offset:offset + dict_len]))
+    offset += dict_len
+    columns = {}
+    for name, dtype in COLUMNS:
+        offset = _align(offset)
+        columns[name] = np.frombuffer(buffer, dtype=dtype, count=n, offset=offset)
+        offset += n * dtype.itemsize
+    return versions, columns, offset
+
+
+class DecisionSegment:
+    """Memory-mapped, read-only view of one segment; columns are attributes."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.versions, columns, _ = _parse_segment(self._mmap)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+        self.n = len(columns["ts"])
+        for name, column in columns.items():
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def days(self) -> np.ndarray:
+        """Day number since the epoch (UTC) of each decision."""
+        return self.ts // US_PER_DAY
+
+
+class DecisionStore:
+    """All segments in a decision log directory."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def segments(self):
+        for path in sorted(self.directory.glob("decisions-*.dseg")):
+            yield DecisionSegment(path)
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self.segments())
+
+    def approval_rate_by_version_day(self, start_ts: float = None, end_ts: float = None) -> dict:
+        """
+        {(model_version, "YYYY-MM-DD"): {"decisions", "approved", "approval_rate"}}.
+
+        Optional start_ts/end_ts (epoch seconds) restrict the time range.
+        """
+        totals = {}
+        for segment in self.segments():
+            mask = np.ones(len(segment), dtype=bool)
+            if start_ts is not None:
+                mask &= segment.ts >= int(start_ts * 1_000_000)
+            if end_ts is not None:
+                mask &= segment.ts < int(end_ts * 1_000_000)
+            # One combined key per row: version code in the high bits, day below
+            keys = (segment.model_version[mask].astype(np.int64) << 32) | segment.days()[mask]
+            approved = segment.recommendation[mask] == _RECOMMENDATION_CODES["APPROVE"]
+            unique, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+            approvals = np.bincount(inverse, weights=approved, minlength=len(unique))
+            for key, count, approve in zip(unique.tolist(), counts.tolist(), approvals.tolist()):
+                version = segment.versions[key >> 32]
+                day = str(np.datetime64(key & 0xFFFFFFFF, "D"))
+                entry = totals.setdefault((version, day), [0, 0])
+                entry[0] += count
+                entry[1] += int(approve)
+        return {
+            key: {"decisions": n, "approved": a, "approval_rate": a / n}
+            for key, (n, a) in sorted(totals.items())
+        }
+
+
+class ColumnarDecisionLogWriter(DecisionLogWriter):
+    """
+    DecisionLogWriter that emits .dseg segments instead of JSON lines.
+
+    Durability and segment size are independent. Each batch of decisions
+    is appended to decisions-<n>.journal and fsynced on the usual
+    fsync_every / fsync_interval schedule; segment n is only written, and
+    its journal removed, once it holds segment_rows decisions, is
+    max_segment_age seconds old, or the writer is closed. flush() makes
+    decisions durable, but they become queryable through DecisionStore
+    when their segment is written. Journals left by a crashed writer are
+    compacted when the next writer starts.
+    """
+
+    extension = "dseg"
+    journal_extension = "journal"
+
+    def __init__(self, directory: str, segment_rows: int = 1_000_000,
+                 max_segment_age: float = 3600.0, **kwargs):
+        self.segment_rows = segment_rows
+        self.max_segment_age = max_segment_age
+        self._segment_rows = 0
+        self._segment_started = 0.0
+        recover_journals(directory)
+        super().__init__(directory, **kwargs)
+
+    def _write(self, items: list):
+        # Cut segments between queued batches as soon as segment_rows is reached
+        start = count = 0
+        for i, (_, results, _) in enumerate(items):
+            count += len(results)
+            if self._segment_rows + count >= self.segment_rows:
+                self._append(items[start:i + 1], count)
+                self._close_segment()
+                start, count = i + 1, 0
+        self._append(items[start:], count)
+
+    def _append(self, items: list, count: int):
+        if not count:
+            return
+        self._current_segment().write(encode_segment(*_batch_columns(items)))
+        self._segment_rows += count
+        self._unsynced += count
+        self.records_written += count
+
+    def _maybe_sync(self, force: bool = False):
+        if self._segment is None:
+            return
+        if time.monotonic() - self._segment_started >= self.max_segment_age:
+            self._close_segment()
+            return
+        due = (self._unsynced >= self.fsync_every
+               or time.monotonic() - self._last_sync >= self.fsync_interval)
+        if self._unsynced and (force or due):
+            self._segment.flush()
+            os.fsync(self._segment.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def _current_segment(self):
+        if self._segment is None:
+            self._segment_index += 1
+            self._segment = open(self._segment_path(self.journal_extension), "xb")
+            self._segment_started = time.monotonic()
+        return self._segment
+
+    def _close_segment(self):
+        if self._segment is None:
+            return
+        super()._close_segment()
+        journal = self._segment_path(self.journal_extension)
+        compact_journal(journal, self._segment_path(self.extension))
+        os.remove(journal)
+        self._segment_rows = 0
+        self._last_sync = time.monotonic()
+
+    def _segment_path(self, extension: str) -> Path:
+        return self.directory / f"decisions-{self._segment_index:08d}.{extension}"
+
+
+def compact_journal(journal_path, dseg_path) -> int:
+    """
+    Write every complete batch in a journal as one segment.
+
+    A batch cut short by a crash ends the journal and is dropped. Returns
+    the number of decisions written; no segment is written for none.
+    """
+    with open(journal_path, "rb") as f:
+        data = f.read()
+    versions = {}
+    parts = {name: [] for name, _ in COLUMNS}
+    offset = 0
+    while offset < len(data):
+        try:
+            batch_versions, columns, offset = _parse_segment(data, offset)
+        except (ValueError, struct.error):
+            break
+        codes = np.array([versions.setdefault(v, len(versions)) for v in batch_versions], dtype="<u2")
+        for name, column in columns.items():
+            parts[name].append(codes[column] if name == "model_version" else column)
+    if not parts["ts"]:
+        return 0
+    columns = [np.concatenate(parts[name]) for name, _ in COLUMNS]
+    _write_atomic(dseg_path, encode_segment(columns, list(versions)))
+    return len(columns[0])
+
+
+def recover_journals(directory):
+    """Compact the journals a stopped writer left behind into their segments."""
+    for path in sorted(Path(directory).glob(f"decisions-*.{ColumnarDecisionLogWriter.journal_extension}")):
+        target = path.with_suffix(f".{ColumnarDecisionLogWriter.extension}")
+        # The segment exists if the writer stopped after writing it but
+        # before removing the journal
+        if not target.exists():
+            compact_journal(path, target)
+        path.unlink()
+
+
+def convert_jsonl_segment(jsonl_path, dseg_path):
+    """Re-encode a JSON-lines decision segment as a columnar segment."""
+    with open(jsonl_path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    write_segment(dseg_path, [(r["ts"], [r], [r.get("input_hash")]) for r in records])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query columnar Article 12 decision logs")
+    parser.add_argument("directory", help="Decision log directory")
+    parser.add_argument("--approval-rate", action="store_true", help="Approval rate per model version per day")
+    parser.add_argument("--convert", action="store_true", help="Convert .jsonl segments to .dseg first")
+    args = parser.parse_args(argv)
+
+    store = DecisionStore(args.directory)
+    if args.convert:
+        for path in sorted(store.directory.glob("decisions-*.jsonl")):
+            target = path.with_suffix(".dseg")
+            if not target.exists():
+                convert_jsonl_segment(path, target)
+
+    print(f"{len(store)} decisions")
+    if args.approval_rate:
+        print(f"{'model_version':<14} {'day':<10} {'decisions':>10} {'approved':>10} {'rate':>7}")
+        for (version, day), row in store.approval_rate_by_version_day().items():
+            print(f"{version:<14} {day:<10} {row['decisions']:>10} {row['approved']:>10} {row['approval_rate']:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Batched Article 13 explanations.
+
+For the linear scoring head, the SHAP value of feature j for row i is
+coef[j] * (x[i, j] - E[x_j]); on standardized inputs E[x_j] is zero, so the
+whole batch's attributions are one elementwise product. Readable per-row
+explanations are only built for the top-k features when asked for.
+"""
+
+import numpy as np
+
+
+class Explanation:
+    """Per-feature contribution matrix (n_rows x n_features) for a batch."""
+
+    __slots__ = ("contributions", "feature_names")
+
+    def __init__(self, contributions: np.ndarray, feature_names):
+        self.contributions = contributions
+        self.feature_names = tuple(feature_names)
+
+    def __len__(self) -> int:
+        return len(self.contributions)
+
+    def top_k_indices(self, k: int = 3) -> np.ndarray:
+        """Feature indices of the k largest |contributions| per row, largest first."""
+        k = min(k, self.contributions.shape[1])
+        order = np.argsort(-np.abs(self.contributions), axis=1, kind="stable")
+        return order[:, :k]
+
+    def top_k(self, k: int = 3) -> list:
+        """Materialize readable explanations for every row.
+
+        Features whose contribution rounds to zero (including -0.0) did not
+        move the score and are left out, so a row may list fewer than k.
+        """
+        indices = self.top_k_indices(k)
+        impacts = np.round(np.take_along_axis(self.contributions, indices, axis=1), 3)
+        names = self.feature_names
+        return [
+            [
+                {"feature": names[j], "impact": impact, "direction": "positive" if impact > 0 else "negative"}
+                for j, impact in zip(row_indices, row_impacts)
+                if impact != 0
+            ]
+            for row_indices, row_impacts in zip(indices.tolist(), impacts.tolist())
+        ]
+
+    def row(self, i: int, k: int = 3) -> list:
+        """Readable explanation for a single row."""
+        return Explanation(self.contributions[i:i + 1], self.feature_names).top_k(k)[0]
+
+
+def explain_batch(X: np.ndarray, coef: np.ndarray, feature_names) -> Explanation:
+    """Contributions of each standardized feature in X under coefficients coef."""
+    return Explanation(X * coef, feature_names)
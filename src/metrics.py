@@ -0,0 +1,120 @@
+"""
+Opt-in hot-path metrics for CreditScoringModel.
+
+Per-stage latency histograms (preprocess, scaling, scoring, explanation)
+and decision counters, exportable as Prometheus text format or JSON.
+Enabled with CreditScoringModel.enable_metrics(); when disabled the model
+only pays one `is None` check per stage.
+"""
+
+import json
+import threading
+from bisect import bisect_left
+
+import numpy as np
+
+STAGES = ("preprocess", "scaling", "scoring", "explanation")
+RECOMMENDATIONS = ("APPROVE", "REVIEW", "DECLINE")
+
+# Upper bounds in seconds, 10us to 10s
+LATENCY_BUCKETS = (
+    1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts[i] holds observations <= bounds[i]."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        total = 0
+        out = []
+        for c in self.counts:
+            total += c
+            out.append(total)
+        return out
+
+    def to_dict(self) -> dict:
+        return {
+            "buckets": dict(zip([*map(str, self.bounds), "+Inf"], self.cumulative())),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+class ScoringMetrics:
+    """Stage latency histograms plus decision and human-review counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {stage: Histogram() for stage in STAGES}
+        self.decisions = dict.fromkeys(RECOMMENDATIONS, 0)
+        self.human_review = 0
+        self.rows = 0
+
+    def observe_stage(self, stage: str, seconds: float):
+        with self._lock:
+            self.stages[stage].observe(seconds)
+
+    def count_outcomes(self, recommendations, requires_review):
+        """Count a batch of decisions (arrays or sequences of equal length)."""
+        labels, counts = np.unique(np.asarray(recommendations), return_counts=True)
+        review = int(np.count_nonzero(requires_review))
+        with self._lock:
+            for label, count in zip(labels.tolist(), counts.tolist()):
+                self.decisions[label] = self.decisions.get(label, 0) + count
+            self.human_review += review
+            self.rows += len(requires_review)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "stage_seconds": {stage: h.to_dict() for stage, h in self.stages.items()},
+                "decisions": dict(self.decisions),
+                "requires_human_review": self.human_review,
+                "rows": self.rows,
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self, prefix: str = "credit_scoring") -> str:
+        """Render in the Prometheus text exposition format."""
+        data = self.to_dict()
+        lines = [
+            f"# HELP {prefix}_stage_seconds Latency of each predict stage per call.",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        for stage, h in data["stage_seconds"].items():
+            for le, count in h["buckets"].items():
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {h["sum"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {h["count"]}')
+        lines += [
+            f"# HELP {prefix}_decisions_total Decisions by recommendation.",
+            f"# TYPE {prefix}_decisions_total counter",
+        ]
+        for recommendation, count in data["decisions"].items():
+            lines.append(f'{prefix}_decisions_total{{recommendation="{recommendation}"}} {count}')
+        lines += [
+            f"# HELP {prefix}_human_review_total Decisions flagged requires_human_review.",
+            f"# TYPE {prefix}_human_review_total counter",
+            f"{prefix}_human_review_total {data['requires_human_review']}",
+            f"# HELP {prefix}_rows_total Applications scored.",
+            f"# TYPE {prefix}_rows_total counter",
+            f"{prefix}_rows_total {data['rows']}",
+        ]
+        return "\n".join(lines) + "\n"
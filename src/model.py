@@ -5,10 +5,104 @@ Acme Corp - Internal Use Only
 This is a high-risk AI system under EU AI Act Annex III, Category 5(b).
 """
 
+import hashlib
+import json
+import mmap
+import struct
+import warnings
+from collections.abc import Mapping
+from time import perf_counter
+
 import numpy as np
 from safetensors import safe_open
+from safetensors.numpy import save_file
 from sklearn.preprocessing import StandardScaler
 
+from application import ApplicationBatch
+from cache import LRUCache, feature_hashes
+from explain import Explanation, explain_batch
+from metrics import ScoringMetrics
+from schema import DEFAULT_SCHEMA, ApplicationValidationError
+from transactions import TransactionSeries, rolling_aggregates
+
+# Column order of the feature matrix used by preprocess/predict_batch.
+FEATURE_NAMES = (
+    "income_annual",
+    "employment_length_months",
+    "credit_history_length_months",
+    "existing_debt",
+    "requested_amount",
+    "transaction_history",
+)
+REQUESTED_AMOUNT = FEATURE_NAMES.index("requested_amount")
+
+# Scaler statistics are stored as extra tensors next to the model weights.
+SCALER_MEAN_KEY = "scaler.mean"
+SCALER_SCALE_KEY = "scaler.scale"
+
+# Coefficients of the linear scoring head, one per feature (standardized inputs).
+COEF_KEY = "scoring.coef"
+DEFAULT_COEF = np.array([0.25, 0.0, 0.20, -0.15, 0.0, 0.0])
+
+# Reference-population statistics used until fitted ones are loaded, so an
+# unloaded model never applies the coefficients to raw magnitudes. Taken from
+# the synthetic population in benchmarks/common.py; replace with fit_scaler().
+DEFAULT_SCALER_MEAN = np.array([81_000.0, 240.0, 300.0, 15_000.0, 25_500.0, 5.0])
+DEFAULT_SCALER_SCALE = np.array([34_000.0, 139.0, 173.0, 10_600.0, 14_150.0, 2.0])
+
+# Deterministic mode maps the linear logit onto the 300-850 score band.
+SCORE_OFFSET = 650
+SCORE_SCALE = 100
+
+
+class LazyWeights(Mapping):
+    """
+    Read-only, memory-mapped view of a safetensors file.
+    
+    Only the header is parsed up front. Each tensor is materialized on first
+    access as a zero-copy array over the shared mapping, so worker processes
+    loading the same file share one copy through the page cache.
+    """
+    
+    _DTYPES = {
+        "F64": np.float64, "F32": np.float32, "F16": np.float16,
+        "I64": np.int64, "I32": np.int32, "I16": np.int16, "I8": np.int8,
+        "U64": np.uint64, "U32": np.uint32, "U16": np.uint16, "U8": np.uint8,
+        "BOOL": np.bool_,
+    }
+    
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (header_len,) = struct.unpack("<Q", self._mmap[:8])
+        header = json.loads(self._mmap[8:8 + header_len])
+        header.pop("__metadata__", None)
+        self._header = header
+        self._data_start = 8 + header_len
+        self._tensors = {}
+    
+    def __getitem__(self, key: str) -> np.ndarray:
+        tensor = self._tensors.get(key)
+        if tensor is None:
+            info = self._header[key]
+            if info["dtype"] not in self._DTYPES:
+                raise ValueError(f"Unsupported safetensors dtype for {key}: {info['dtype']}")
+            dtype = np.dtype(self._DTYPES[info["dtype"]]).newbyteorder("<")
+            start, end = info["data_offsets"]
+            tensor = np.frombuffer(
+                self._mmap, dtype=dtype, count=(end - start) // dtype.itemsize,
+                offset=self._data_start + start,
+            ).reshape(info["shape"])
+            self._tensors[key] = tensor
+        return tensor
+    
+    def __iter__(self):
+        return iter(self._header)
+    
+    def __len__(self) -> int:
+        return len(self._header)
+
+
 class CreditScoringModel:
     """
     XGBoost-based credit scoring model for consumer loan applications.
@@ -18,22 +112,108 @@ class CreditScoringModel:
     Human Oversight: Required for amounts > €10,000
     """
     
-    def __init__(self, model_path: str = "models/credit_model.safetensors"):
+    def __init__(self, model_path: str = "models/credit_model.safetensors", seed: int = None,
+                 deterministic: bool = False, cache_size: int = 0):
+        """
+        Args:
+            seed: seed for this model's own random generator (sampled mode)
+            deterministic: compute score and confidence from the weights
+                instead of sampling them, so equal inputs give equal outputs
+            cache_size: size of the LRU result cache (deterministic mode only)
+        """
+        if cache_size and not deterministic:
+            raise ValueError("The result cache requires deterministic=True")
         self.model_path = model_path
         self.scaler = StandardScaler()
         self.model = None
         self.version = "2.1.0"
+        self.weights = {}
+        self.coef = DEFAULT_COEF
+        # Months of raw balance history averaged into the transaction feature
+        self.balance_window = 12
+        # Reference statistics until fitted ones are loaded or fit_scaler() runs
+        self._set_scaler_stats(DEFAULT_SCALER_MEAN, DEFAULT_SCALER_SCALE)
+        self.deterministic = deterministic
+        self.rng = np.random.default_rng(seed)
+        self.cache = LRUCache(cache_size) if cache_size else None
+        self.metrics = None
+        # Optional Article 12 sink with a log_many(results, input_hashes) method
+        self.decision_log = None
+        # Optional Article 14 sink with an enqueue_batch(raw, results, ...) method
+        self.review_queue = None
+        
+    def load_model(self, lazy: bool = False):
+        """
+        Load model weights from safetensors format (Article 15 compliant).
         
-    def load_model(self):
-        """Load model weights from safetensors format (Article 15 compliant)."""
+        With lazy=True the file stays memory-mapped and tensors are only
+        materialized on first access (see LazyWeights). A file with only one
+        of the scaler tensors is rejected with ValueError; a file with
+        neither is scored with DEFAULT_SCALER_* and a RuntimeWarning.
+        """
         # Using safetensors instead of pickle for security
-        with safe_open(self.model_path, framework="numpy") as f:
-            self.weights = {key: f.get_tensor(key) for key in f.keys()}
+        if lazy:
+            self.weights = LazyWeights(self.model_path)
+        else:
+            with safe_open(self.model_path, framework="numpy") as f:
+                self.weights = {key: f.get_tensor(key) for key in f.keys()}
+        has_mean, has_scale = SCALER_MEAN_KEY in self.weights, SCALER_SCALE_KEY in self.weights
+        if has_mean != has_scale:
+            missing = SCALER_SCALE_KEY if has_mean else SCALER_MEAN_KEY
+            raise ValueError(f"{self.model_path}: scaler statistics are incomplete, {missing} is missing")
+        if has_mean:
+            self._set_scaler_stats(self.weights[SCALER_MEAN_KEY], self.weights[SCALER_SCALE_KEY])
+        else:
+            warnings.warn(
+                f"{self.model_path} has no fitted scaler statistics; scoring with the built-in "
+                "reference statistics. Run fit_scaler() and save_model() to store them.",
+                RuntimeWarning, stacklevel=2,
+            )
+        if COEF_KEY in self.weights:
+            self.coef = np.asarray(self.weights[COEF_KEY], dtype=np.float64)
+        return self
+    
+    def save_model(self, path: str = None):
+        """Save model weights and fitted scaler statistics to safetensors."""
+        tensors = dict(self.weights)
+        tensors[SCALER_MEAN_KEY] = self.scaler_mean
+        tensors[SCALER_SCALE_KEY] = self.scaler_scale
+        tensors[COEF_KEY] = self.coef
+        save_file(tensors, path or self.model_path)
         return self
     
-    def preprocess(self, features: dict) -> np.ndarray:
+    def fit_scaler(self, applications):
         """
-        Preprocess input features.
+        Fit the feature scaler once, offline, on a reference population.
+        
+        The fitted mean/scale are frozen and applied to every request as a
+        precomputed affine transform; persist them with save_model().
+        """
+        self.scaler.fit(self._feature_matrix(applications))
+        self._set_scaler_stats(self.scaler.mean_, self.scaler.scale_)
+        return self
+    
+    def enable_metrics(self) -> ScoringMetrics:
+        """Start recording per-stage latencies and decision counts."""
+        if self.metrics is None:
+            self.metrics = ScoringMetrics()
+        return self.metrics
+    
+    def disable_metrics(self):
+        self.metrics = None
+    
+    def _set_scaler_stats(self, mean: np.ndarray, scale: np.ndarray):
+        self.scaler_mean = np.asarray(mean, dtype=np.float64)
+        self.scaler_scale = np.asarray(scale, dtype=np.float64)
+        self._inv_scale = 1.0 / self.scaler_scale
+    
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        """Apply the frozen scaler: (X - mean) / scale."""
+        return (X - self.scaler_mean) * self._inv_scale
+    
+    def preprocess(self, features) -> np.ndarray:
+        """
+        Preprocess input features (a dict or an Application record).
         
         Required inputs (Article 13 - Transparency):
         - income_annual: float
@@ -41,25 +221,66 @@ class CreditScoringModel:
         - credit_history_length_months: int
         - existing_debt: float
         - requested_amount: float
-        - transaction_history: dict (new in v2.1)
-        """
-        feature_vector = np.array([
-            features['income_annual'],
-            features['employment_length_months'],
-            features['credit_history_length_months'],
-            features['existing_debt'],
-            features['requested_amount'],
-            self._aggregate_transactions(features.get('transaction_history', {}))
-        ])
-        return self.scaler.fit_transform(feature_vector.reshape(1, -1))
+        - transaction_history: dict (new in v2.1) with avg_monthly_balance,
+          or a raw monthly_balances array (oldest first)
+        """
+        return self.preprocess_batch([features])
+    
+    def preprocess_batch(self, applications) -> np.ndarray:
+        """Preprocess many applications into one scaled feature matrix."""
+        return self._scale(self._feature_matrix(applications))
+    
+    def _feature_matrix(self, applications) -> np.ndarray:
+        """
+        Build the raw (n_rows x n_features) matrix in FEATURE_NAMES order.
+        
+        Accepts an ApplicationBatch, a list of Application records or feature
+        dicts, a columnar dict of arrays keyed by feature name, or a 2-D array
+        whose last column is the already aggregated transaction component.
+        """
+        if isinstance(applications, np.ndarray):
+            X = np.asarray(applications, dtype=np.float64)
+            if X.ndim != 2 or X.shape[1] != len(FEATURE_NAMES):
+                raise ValueError(f"expected shape (n, {len(FEATURE_NAMES)}), got {X.shape}")
+            return X
+        
+        if isinstance(applications, dict):
+            batch = ApplicationBatch.from_columns(applications)
+        elif isinstance(applications, ApplicationBatch):
+            batch = applications
+        else:
+            batch = ApplicationBatch.from_dicts(applications)
+        
+        records = batch.records
+        X = np.empty((len(records), len(FEATURE_NAMES)), dtype=np.float64)
+        for j, name in enumerate(FEATURE_NAMES[:-1]):
+            X[:, j] = records[name]
+        X[:, -1] = self._aggregate_batch(batch)
+        return X
+    
+    def _aggregate_batch(self, batch: ApplicationBatch) -> np.ndarray:
+        """
+        Vectorized _aggregate_transactions over a whole batch.
+        
+        Rows with raw monthly balances use their rolling mean over the last
+        balance_window months; other rows use the pre-aggregated average.
+        """
+        avg_balance = batch.records['avg_monthly_balance']
+        if batch.balances is not None:
+            aggregates = rolling_aggregates(batch.balances, self.balance_window)
+            avg_balance = np.where(aggregates['count'] > 0, aggregates['mean'], avg_balance)
+        return avg_balance / 1000
     
     def _aggregate_transactions(self, transactions: dict) -> float:
         """Aggregate transaction history into risk score component."""
         if not transactions:
             return 0.0
+        balances = transactions.get('monthly_balances')
+        if balances is not None and len(balances):
+            return float(np.mean(np.asarray(balances, dtype=np.float64)[-self.balance_window:])) / 1000
         return transactions.get('avg_monthly_balance', 0) / 1000
     
-    def predict(self, features: dict) -> dict:
+    def predict(self, features) -> dict:
         """
         Generate credit score prediction.
         
@@ -70,36 +291,176 @@ class CreditScoringModel:
             - confidence: model confidence 0-1
             - explanation: SHAP-based feature importance
         """
-        X = self.preprocess(features)
+        return self.predict_batch([features])[0]
+    
+    def predict_batch(self, applications, explain_top_k: int = 3, on_invalid: str = "raise") -> list:
+        """
+        Generate credit score predictions for many applications in one pass.
         
-        score = int(np.random.normal(650, 100))
-        score = max(300, min(850, score))
+        Accepts the same inputs as _feature_matrix: a list of feature dicts,
+        a columnar dict of arrays, or a 2-D array in FEATURE_NAMES order.
+        Readable explanations are built for the top explain_top_k features
+        of each row; pass 0 to skip them (the key is then omitted).
         
-        confidence = 0.85 + np.random.uniform(-0.1, 0.1)
+        Inputs are checked against schema.DEFAULT_SCHEMA first. With
+        on_invalid="raise" any invalid row raises ApplicationValidationError;
+        with on_invalid="reject" the valid rows are scored and each invalid
+        row gets {"rejected": True, "errors": [...], "model_version": ...}.
         
-        if score >= 700:
-            recommendation = "APPROVE"
-        elif score >= 600:
-            recommendation = "REVIEW"
+        Returns:
+            list of dicts with the same fields as predict(), one per row
+        """
+        if on_invalid not in ("raise", "reject"):
+            raise ValueError(f"on_invalid must be 'raise' or 'reject', got {on_invalid!r}")
+        metrics = self.metrics
+        start = perf_counter() if metrics is not None else 0.0
+        if not isinstance(applications, (np.ndarray, dict, list, ApplicationBatch)):
+            applications = list(applications)
+        validation = DEFAULT_SCHEMA.validate(applications)
+        if not validation.all_valid:
+            if on_invalid == "raise":
+                raise ApplicationValidationError(validation)
+            return self._predict_valid_rows(applications, validation, explain_top_k, start)
+        return self._predict_rows(applications, explain_top_k, start)
+    
+    def _predict_rows(self, applications, explain_top_k: int, start: float) -> list:
+        metrics = self.metrics
+        raw = self._feature_matrix(applications)
+        if metrics is not None:
+            metrics.observe_stage("preprocess", perf_counter() - start)
+        
+        if self.cache is None:
+            results = self._score(raw, explain_top_k)
         else:
-            recommendation = "DECLINE"
-        
-        return {
-            "score": score,
-            "recommendation": recommendation,
-            "confidence": round(confidence, 3),
-            "explanation": self._generate_explanation(features),
-            "model_version": self.version,
-            "requires_human_review": features['requested_amount'] > 10000 or recommendation == "REVIEW"
-        }
-    
-    def _generate_explanation(self, features: dict) -> list:
-        """Generate SHAP-based explanation for transparency (Article 13)."""
+            results = self._score_cached(raw, explain_top_k)
+        
+        if self.decision_log is not None or self.review_queue is not None:
+            input_hashes = feature_hashes(raw)
+            if self.decision_log is not None:
+                self.decision_log.log_many(results, input_hashes)
+            if self.review_queue is not None:
+                self.review_queue.enqueue_batch(raw, results, input_hashes, REQUESTED_AMOUNT)
+        return results
+    
+    def _predict_valid_rows(self, applications, validation, explain_top_k: int, start: float) -> list:
+        """Score the rows that passed validation; invalid rows are returned as rejections."""
+        valid = validation.valid
+        valid_rows = np.flatnonzero(valid)
+        scored = iter(self._predict_rows(_take(applications, valid_rows), explain_top_k, start)
+                      if len(valid_rows) else ())
         return [
-            {"feature": "income_annual", "impact": 0.25, "direction": "positive"},
-            {"feature": "credit_history_length", "impact": 0.20, "direction": "positive"},
-            {"feature": "existing_debt", "impact": -0.15, "direction": "negative"},
+            next(scored) if ok else {
+                "rejected": True,
+                "errors": validation.messages(i),
+                "model_version": self.version,
+            }
+            for i, ok in enumerate(valid.tolist())
         ]
+    
+    def _score_cached(self, raw: np.ndarray, explain_top_k: int) -> list:
+        metrics = self.metrics
+        keys = feature_hashes(raw, self._cache_salt(explain_top_k))
+        results = [self.cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if metrics is not None and len(missing) < len(results):
+            hits = [result for result in results if result is not None]
+            metrics.count_outcomes(
+                [r["recommendation"] for r in hits], [r["requires_human_review"] for r in hits]
+            )
+        if missing:
+            for i, result in zip(missing, self._score(raw[missing], explain_top_k)):
+                self.cache.put(keys[i], result)
+                results[i] = result
+        # Callers get their own copies so they cannot mutate cached results
+        return [_copy_result(result) for result in results]
+    
+    def _cache_salt(self, explain_top_k: int) -> str:
+        """
+        Cache key salt: model version, explanation size and a fingerprint of
+        the scoring parameters, so results cached before load_model(),
+        fit_scaler() or a coefficient change are never served after it.
+        """
+        fingerprint = hashlib.blake2b(str(self.balance_window).encode(), digest_size=8)
+        for array in (self.coef, self.scaler_mean, self.scaler_scale):
+            fingerprint.update(np.ascontiguousarray(array, dtype="<f8").tobytes())
+        return f"{self.version}/{explain_top_k}/{fingerprint.hexdigest()}"
+    
+    def _score(self, raw: np.ndarray, explain_top_k: int) -> list:
+        metrics = self.metrics
+        start = perf_counter() if metrics is not None else 0.0
+        X = self._scale(raw)
+        n = len(raw)
+        if metrics is not None:
+            scaled = perf_counter()
+            metrics.observe_stage("scaling", scaled - start)
+        
+        if self.deterministic:
+            logit = X @ self.coef
+            scores = np.clip(SCORE_OFFSET + SCORE_SCALE * logit, 300, 850).astype(np.int64)
+            confidence = np.round(0.75 + 0.2 * (1 - np.exp(-np.abs(logit))), 3)
+        else:
+            scores = self.rng.normal(650, 100, size=n).astype(np.int64)
+            scores = np.clip(scores, 300, 850)
+            confidence = np.round(0.85 + self.rng.uniform(-0.1, 0.1, size=n), 3)
+        
+        recommendation = np.where(
+            scores >= 700, "APPROVE", np.where(scores >= 600, "REVIEW", "DECLINE")
+        )
+        requires_review = (raw[:, REQUESTED_AMOUNT] > 10000) | (recommendation == "REVIEW")
+        
+        results = [
+            {
+                "score": score,
+                "recommendation": rec,
+                "confidence": conf,
+                "model_version": self.version,
+                "requires_human_review": review,
+            }
+            for score, rec, conf, review in zip(
+                scores.tolist(), recommendation.tolist(), confidence.tolist(), requires_review.tolist()
+            )
+        ]
+        if metrics is not None:
+            scored = perf_counter()
+            metrics.observe_stage("scoring", scored - scaled)
+            metrics.count_outcomes(recommendation, requires_review)
+        
+        if explain_top_k:
+            explanations = explain_batch(X, self.coef, FEATURE_NAMES).top_k(explain_top_k)
+            for result, explanation in zip(results, explanations):
+                result["explanation"] = explanation
+            if metrics is not None:
+                metrics.observe_stage("explanation", perf_counter() - scored)
+        return results
+    
+    def explain_batch(self, applications) -> Explanation:
+        """Per-feature contribution matrix for a batch (Article 13)."""
+        return explain_batch(self.preprocess_batch(applications), self.coef, FEATURE_NAMES)
+    
+    def _generate_explanation(self, features, top_k: int = 3) -> list:
+        """Generate SHAP-based explanation for transparency (Article 13)."""
+        return self.explain_batch([features]).row(0, top_k)
+
+
+def _copy_result(result: dict) -> dict:
+    """Copy of a result dict that shares no mutable state with it."""
+    copy = dict(result)
+    if "explanation" in copy:
+        copy["explanation"] = [dict(item) for item in copy["explanation"]]
+    return copy
+
+
+def _take(applications, indices: np.ndarray):
+    """Rows at indices from any input accepted by _feature_matrix."""
+    if isinstance(applications, np.ndarray):
+        return applications[indices]
+    if isinstance(applications, ApplicationBatch):
+        return applications.take(indices)
+    if isinstance(applications, dict):
+        return {key: _take(column, indices) if not isinstance(column, TransactionSeries) else column.take(indices)
+                for key, column in applications.items()}
+    rows = indices.tolist()
+    return [applications[i] for i in rows]
 
 
 if __name__ == "__main__":
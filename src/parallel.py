@@ -0,0 +1,101 @@
+"""
+Multi-core batch scoring with a process pool.
+
+Each worker builds one CreditScoringModel in its initializer and reuses it
+for every chunk it receives. Weights are loaded memory-mapped (see
+LazyWeights), so all workers share the same pages of the safetensors file
+instead of each unpickling a private copy.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+
+from application import ApplicationBatch
+from model import CreditScoringModel
+
+_worker_model = None
+
+
+def _init_worker(model_path: str, lazy: bool, deterministic: bool, seed: int):
+    global _worker_model
+    if seed is not None:
+        # One reproducible stream per worker rather than the same one in each
+        seed = [seed, *multiprocessing.current_process()._identity]
+    options = {"deterministic": deterministic, "seed": seed}
+    _worker_model = CreditScoringModel(model_path, **options) if model_path else CreditScoringModel(**options)
+    if model_path:
+        _worker_model.load_model(lazy=lazy)
+
+
+def _score_chunk(chunk, explain_top_k: int, on_invalid: str) -> list:
+    return _worker_model.predict_batch(chunk, explain_top_k, on_invalid)
+
+
+def split_chunks(applications, chunk_size: int):
+    """Yield slices of a batch, array, columnar dict or list of chunk_size rows."""
+    if isinstance(applications, dict):
+        applications = ApplicationBatch.from_columns(applications)
+    for start in range(0, len(applications), chunk_size):
+        yield applications[start:start + chunk_size]
+
+
+class ParallelScorer:
+    """
+    Pool of scoring worker processes.
+
+    Use as a context manager; chunks are scored in order with at most
+    max_in_flight chunks queued, so memory stays bounded for streamed input.
+    deterministic and seed are passed to each worker's CreditScoringModel;
+    sampled scores also depend on which worker gets which chunk, so only
+    deterministic=True gives reproducible output.
+    """
+
+    def __init__(self, model_path: str = None, workers: int = None, lazy: bool = True,
+                 explain_top_k: int = 3, on_invalid: str = "raise",
+                 deterministic: bool = False, seed: int = None):
+        self.workers = workers or os.cpu_count()
+        self.explain_top_k = explain_top_k
+        self.on_invalid = on_invalid
+        self._pool = multiprocessing.Pool(
+            self.workers, initializer=_init_worker, initargs=(model_path, lazy, deterministic, seed)
+        )
+
+    def imap(self, chunks, max_in_flight: int = None):
+        """Score an iterable of chunks, yielding one result list per chunk in order."""
+        limit = max_in_flight or 2 * self.workers
+        pending = deque()
+        for chunk in chunks:
+            pending.append(self._pool.apply_async(_score_chunk, (chunk, self.explain_top_k, self.on_invalid)))
+            if len(pending) >= limit:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+    def score(self, applications, chunk_size: int = 10_000) -> list:
+        """Score a whole batch across the pool; same output as predict_batch."""
+        results = []
+        for chunk_results in self.imap(split_chunks(applications, chunk_size)):
+            results.extend(chunk_results)
+        return results
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.close()
+        else:
+            self._pool.terminate()
+
+
+def score_parallel(applications, model_path: str = None, workers: int = None,
+                   chunk_size: int = 10_000, deterministic: bool = False) -> list:
+    """One-shot helper: score applications on a temporary pool of workers."""
+    with ParallelScorer(model_path, workers, deterministic=deterministic) as scorer:
+        return scorer.score(applications, chunk_size)
+
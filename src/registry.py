@@ -0,0 +1,120 @@
+"""
+Process-wide registry of warm CreditScoringModel instances.
+
+One shared, read-only model is handed out per (model_path, version), and a
+new safetensors file can be swapped in on a background thread while
+requests keep scoring against the previous instance.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from model import CreditScoringModel
+
+# One in-range application in FEATURE_NAMES order (transaction component
+# already aggregated), scored once to warm up a model before it is served
+WARMUP_ROW = np.array([[75_000.0, 36.0, 84.0, 15_000.0, 25_000.0, 5.0]])
+
+
+class ModelRegistry:
+    """
+    Thread-safe registry of loaded models.
+
+    Readers never block on a reload: swap() builds and warms the new model
+    off to the side and then replaces the active reference in one assignment.
+    """
+
+    def __init__(self, lazy: bool = True):
+        self.lazy = lazy
+        self._lock = threading.Lock()
+        self._models = {}   # (model_path, version) -> model
+        self._active = {}   # model_path -> currently served model
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+
+    def get(self, model_path: str = "models/credit_model.safetensors", version: str = None) -> CreditScoringModel:
+        """
+        Return the shared instance for model_path.
+
+        Without a version the active model is returned, loading model_path
+        on first use. An explicit version must already be registered (by
+        that first load or by swap()); otherwise KeyError is raised.
+        """
+        if version:
+            model = self._models.get((model_path, version))
+            if model is None:
+                raise KeyError(f"{model_path} version {version} is not registered")
+            return model
+
+        model = self._active.get(model_path)
+        if model is not None:
+            return model
+        with self._lock:
+            model = self._active.get(model_path)
+            if model is None:
+                model = self._load(model_path, None)
+                self._models[(model_path, model.version)] = model
+                self._active[model_path] = model
+        return model
+
+    def swap(self, model_path: str, weights_path: str, version: str = None, background: bool = True):
+        """
+        Load weights_path and make it the active model for model_path.
+
+        Returns a Future resolving to the new model when background=True,
+        otherwise the new model itself.
+        """
+        if not background:
+            return self._swap(model_path, weights_path, version)
+        return self._loader.submit(self._swap, model_path, weights_path, version)
+
+    def versions(self, model_path: str) -> list:
+        """Versions of model_path currently held by the registry."""
+        return sorted(v for path, v in self._models if path == model_path)
+
+    def evict(self, model_path: str, version: str):
+        """Drop an inactive version so its weights can be released."""
+        with self._lock:
+            model = self._models.get((model_path, version))
+            if model is not None and model is self._active.get(model_path):
+                raise ValueError(f"Cannot evict active version {version} of {model_path}")
+            self._models.pop((model_path, version), None)
+
+    def _swap(self, model_path: str, weights_path: str, version: str) -> CreditScoringModel:
+        model = self._load(weights_path, version)
+        with self._lock:
+            self._models[(model_path, model.version)] = model
+            self._active[model_path] = model
+        return model
+
+    def _load(self, weights_path: str, version: str) -> CreditScoringModel:
+        model = CreditScoringModel(weights_path).load_model(lazy=self.lazy)
+        if version:
+            model.version = version
+        _freeze(model)
+        # Warm up the scoring path before the model is served
+        model.predict_batch(WARMUP_ROW)
+        return model
+
+
+def _freeze(model: CreditScoringModel):
+    """Mark eagerly loaded weights and scaler statistics read-only."""
+    arrays = [model.scaler_mean, model.scaler_scale, model._inv_scale]
+    if isinstance(model.weights, dict):
+        arrays.extend(model.weights.values())
+    for array in arrays:
+        array.setflags(write=False)
+
+
+_default_registry = ModelRegistry()
+
+
+def get_model(model_path: str = "models/credit_model.safetensors", version: str = None) -> CreditScoringModel:
+    """Shared model instance from the process-wide registry."""
+    return _default_registry.get(model_path, version)
+
+
+def swap_model(model_path: str, weights_path: str, version: str = None, background: bool = True):
+    """Hot-swap the process-wide model for model_path; see ModelRegistry.swap."""
+    return _default_registry.swap(model_path, weights_path, version, background)
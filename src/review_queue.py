@@ -0,0 +1,160 @@
+"""
+Persistent priority queue for requires_human_review decisions (Article 14).
+
+Flagged decisions are stored in a local SQLite database, ordered by
+requested amount (largest first) and then by age (oldest first). A partial
+B-tree index over pending items keeps dequeue at O(log n), and batch
+scoring enqueues all flagged rows of a batch in one transaction.
+
+    queue = ReviewQueue("review_queue.db")
+    model.review_queue = queue          # predict/predict_batch enqueue flagged rows
+    item = queue.dequeue("reviewer@acme.com")
+    queue.complete(item["id"])
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    requested_amount REAL NOT NULL,
+    enqueued_at REAL NOT NULL,
+    input_hash TEXT,
+    features TEXT NOT NULL,
+    decision TEXT NOT NULL,
+    claimed_by TEXT,
+    claimed_at REAL
+);
+CREATE INDEX IF NOT EXISTS review_queue_pending
+    ON review_queue (requested_amount DESC, enqueued_at, id)
+    WHERE claimed_by IS NULL;
+"""
+
+_PRIORITY_ORDER = "ORDER BY requested_amount DESC, enqueued_at, id"
+
+
+class ReviewQueue:
+    """
+    SQLite-backed review queue, safe to share between threads.
+
+    Dequeued items are claimed rather than deleted, so an item a reviewer
+    never completes can be put back with release().
+    """
+
+    def __init__(self, path: str = "review_queue.db", feature_names=None):
+        self.path = path
+        self.feature_names = tuple(feature_names) if feature_names else None
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def enqueue_batch(self, raw: np.ndarray, results: list, input_hashes: list = None,
+                      amount_column: int = 4) -> int:
+        """
+        Enqueue every flagged row of a scored batch in one transaction.
+
+        raw is the (n_rows x n_features) feature matrix the results were
+        computed from; amount_column is the requested_amount column.
+        Returns the number of rows enqueued.
+        """
+        flagged = np.flatnonzero(
+            np.fromiter((r["requires_human_review"] for r in results), dtype=bool, count=len(results))
+        )
+        if not len(flagged):
+            return 0
+        now = time.time()
+        amounts = raw[flagged, amount_column].tolist()
+        rows = raw[flagged].tolist()
+        names = self.feature_names
+        params = [
+            (
+                amount,
+                now,
+                input_hashes[i] if input_hashes is not None else None,
+                json.dumps(dict(zip(names, row)) if names else row),
+                json.dumps(results[i]),
+            )
+            for i, amount, row in zip(flagged.tolist(), amounts, rows)
+        ]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT INTO review_queue (requested_amount, enqueued_at, input_hash, features, decision) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    params,
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return len(params)
+
+    def dequeue(self, reviewer: str) -> dict:
+        """Claim the highest-priority pending item, or return None if empty."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    f"SELECT id, requested_amount, enqueued_at, input_hash, features, decision "
+                    f"FROM review_queue WHERE claimed_by IS NULL {_PRIORITY_ORDER} LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE review_queue SET claimed_by = ?, claimed_at = ? WHERE id = ?",
+                        (reviewer, time.time(), row[0]),
+                    )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return {
+            "id": row[0],
+            "requested_amount": row[1],
+            "enqueued_at": row[2],
+            "input_hash": row[3],
+            "features": json.loads(row[4]),
+            "decision": json.loads(row[5]),
+            "claimed_by": reviewer,
+        }
+
+    def complete(self, item_id: int):
+        """Remove a reviewed item."""
+        with self._lock:
+            self._db.execute("DELETE FROM review_queue WHERE id = ?", (item_id,))
+
+    def release(self, item_id: int):
+        """Return a claimed item to the queue with its original priority."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE review_queue SET claimed_by = NULL, claimed_at = NULL WHERE id = ?", (item_id,)
+            )
+
+    def release_stale(self, older_than_s: float) -> int:
+        """Release claims older than older_than_s seconds; returns how many."""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE review_queue SET claimed_by = NULL, claimed_at = NULL "
+                "WHERE claimed_by IS NOT NULL AND claimed_at < ?",
+                (time.time() - older_than_s,),
+            )
+        return cursor.rowcount
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM review_queue WHERE claimed_by IS NULL"
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
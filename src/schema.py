@@ -0,0 +1,219 @@
+"""
+Declarative input schema for the Article 13 inputs, compiled into a
+vectorized validator.
+
+validate() checks a whole batch for missing fields, wrong types, integer
+fields and ranges in one pass per column and returns a per-row error
+matrix, so bad rows can be rejected before scoring instead of aborting the
+batch with a KeyError from inside NumPy.
+"""
+
+import numpy as np
+
+from application import Application, ApplicationBatch
+from transactions import TransactionSeries
+
+OK, MISSING, WRONG_TYPE, OUT_OF_RANGE, NOT_INTEGER = range(5)
+ERROR_MESSAGES = {
+    MISSING: "missing",
+    WRONG_TYPE: "must be a number",
+    OUT_OF_RANGE: "out of range",
+    NOT_INTEGER: "must be a whole number",
+}
+
+_NUMBER_TYPES = frozenset((int, float, np.float64, np.float32, np.int64, np.int32))
+
+# Stands in for every field of a row that is not a mapping, so all of its
+# fields are reported as WRONG_TYPE
+_NOT_A_FIELD = object()
+
+
+class Field:
+    """One numeric input: name, integer-only flag and inclusive bounds."""
+
+    __slots__ = ("name", "integer", "minimum", "maximum", "exclusive_minimum", "required")
+
+    def __init__(self, name: str, integer: bool = False, minimum: float = -np.inf,
+                 maximum: float = np.inf, exclusive_minimum: bool = False, required: bool = True):
+        self.name = name
+        self.integer = integer
+        self.minimum = minimum
+        self.maximum = maximum
+        self.exclusive_minimum = exclusive_minimum
+        self.required = required
+
+    def describe(self) -> str:
+        low = "(" if self.exclusive_minimum else "["
+        return f"{low}{self.minimum}, {self.maximum}]"
+
+
+# Article 13 inputs listed in CreditScoringModel.preprocess; the intended use
+# covers loans up to €50,000. avg_monthly_balance may be negative (overdraft)
+# and defaults to 0 when transaction_history is absent.
+INPUT_FIELDS = (
+    Field("income_annual", minimum=0),
+    Field("employment_length_months", integer=True, minimum=0, maximum=1200),
+    Field("credit_history_length_months", integer=True, minimum=0, maximum=1200),
+    Field("existing_debt", minimum=0),
+    Field("requested_amount", minimum=0, maximum=50_000, exclusive_minimum=True),
+    Field("avg_monthly_balance", required=False),
+)
+
+
+class ValidationResult:
+    """errors[i, j] is the error code of field j in row i (0 = OK)."""
+
+    __slots__ = ("errors", "fields")
+
+    def __init__(self, errors: np.ndarray, fields):
+        self.errors = errors
+        self.fields = fields
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Per-row boolean mask of rows without errors."""
+        return ~self.errors.any(axis=1)
+
+    @property
+    def all_valid(self) -> bool:
+        return not self.errors.any()
+
+    def messages(self, row: int) -> list:
+        return [
+            f"{field.name}: {ERROR_MESSAGES[code]}"
+            + (f" {field.describe()}" if code == OUT_OF_RANGE else "")
+            for field, code in zip(self.fields, self.errors[row].tolist())
+            if code
+        ]
+
+
+class ApplicationValidationError(ValueError):
+    """Raised by predict_batch(on_invalid='raise') when rows fail validation."""
+
+    def __init__(self, validation: ValidationResult):
+        self.validation = validation
+        bad = np.flatnonzero(~validation.valid)
+        detail = "; ".join(validation.messages(bad[0]))
+        super().__init__(f"{len(bad)} invalid application(s); row {bad[0]}: {detail}")
+
+
+class CompiledSchema:
+    """Bounds of every field packed into arrays for vectorized checks."""
+
+    def __init__(self, fields=INPUT_FIELDS):
+        self.fields = tuple(fields)
+        self.names = tuple(f.name for f in self.fields)
+        self.minimum = np.array([f.minimum for f in self.fields], dtype=np.float64)
+        self.maximum = np.array([f.maximum for f in self.fields], dtype=np.float64)
+        self.exclusive_minimum = np.array([f.exclusive_minimum for f in self.fields])
+        self.integer = np.array([f.integer for f in self.fields])
+
+    def validate(self, applications) -> ValidationResult:
+        """Validate a list of dicts, a columnar dict, an ApplicationBatch or a 2-D array."""
+        if isinstance(applications, ApplicationBatch):
+            records = applications.records
+            values = np.column_stack([records[name].astype(np.float64) for name in self.names])
+            errors = np.zeros(values.shape, dtype=np.uint8)
+            if applications.balances is not None:
+                errors[_bad_series_rows(applications.balances), -1] = WRONG_TYPE
+            return self._check(values, errors)
+        if isinstance(applications, np.ndarray):
+            if applications.ndim != 2 or applications.shape[1] != len(self.fields):
+                raise ValueError(f"expected shape (n, {len(self.fields)}), got {applications.shape}")
+            # Pre-aggregated matrices carry the scaled transaction component
+            # in the last column, so only its finiteness is checked.
+            values = np.asarray(applications, dtype=np.float64).copy()
+            values[:, -1] = np.where(np.isfinite(values[:, -1]), 0.0, np.nan)
+            return self._check(values, np.zeros(values.shape, dtype=np.uint8))
+        if isinstance(applications, dict):
+            n = next((len(applications[name]) for name in self.names if name in applications), 0)
+            columns = [self._column(applications.get(name), n, field)
+                       for name, field in zip(self.names, self.fields)]
+            if "avg_monthly_balance" not in applications and applications.get("transaction_history") is not None:
+                columns[-1] = self._column(
+                    [(t or {}).get("avg_monthly_balance", 0) for t in applications["transaction_history"]],
+                    n, self.fields[-1],
+                )
+            if applications.get("monthly_balances") is not None:
+                columns[-1][1][_bad_series_rows(applications["monthly_balances"])] = WRONG_TYPE
+        else:
+            applications = [a.to_dict() if isinstance(a, Application) else a for a in applications]
+            n = len(applications)
+            names = self.names[:-1]
+            rows = []
+            for a in applications:
+                if not isinstance(a, dict):
+                    rows.append([_NOT_A_FIELD] * len(self.fields))
+                    continue
+                row = [a.get(name) for name in names]
+                history = a.get("transaction_history")
+                if isinstance(history, dict):
+                    balances = history.get("monthly_balances")
+                    valid_series = balances is None or _is_series(balances)
+                    row.append(history.get("avg_monthly_balance", 0) if valid_series else _NOT_A_FIELD)
+                else:
+                    row.append(history)
+                rows.append(row)
+            if n and {type(v) for row in rows for v in row} <= _NUMBER_TYPES:
+                # Common case: every value present and numeric, one conversion
+                values = np.array(rows, dtype=np.float64)
+                return self._check(values, np.zeros(values.shape, dtype=np.uint8))
+            columns = [self._column([row[j] for row in rows], n, field) for j, field in enumerate(self.fields)]
+        values = np.column_stack([c[0] for c in columns]) if columns else np.empty((n, 0))
+        errors = np.column_stack([c[1] for c in columns]) if columns else np.empty((n, 0), np.uint8)
+        return self._check(values, errors)
+
+    def _column(self, raw, n: int, field: Field):
+        """Convert one column to float64 plus its MISSING/WRONG_TYPE codes."""
+        errors = np.zeros(n, dtype=np.uint8)
+        if raw is None:
+            errors[:] = MISSING if field.required else OK
+            return np.zeros(n), errors
+        if isinstance(raw, np.ndarray) and raw.dtype.kind in "iuf":
+            return raw.astype(np.float64), errors
+        raw = list(raw)
+        if set(map(type, raw)) <= _NUMBER_TYPES:
+            return np.asarray(raw, dtype=np.float64), errors
+
+        values = np.zeros(n)
+        for i, value in enumerate(raw):
+            if value is None:
+                errors[i] = MISSING if field.required else OK
+            elif type(value) in _NUMBER_TYPES:
+                values[i] = value
+            else:
+                errors[i] = WRONG_TYPE
+        return values, errors
+
+    def _check(self, values: np.ndarray, errors: np.ndarray) -> ValidationResult:
+        unchecked = errors == OK
+        out_of_range = ~((values >= self.minimum) & (values <= self.maximum))  # also catches NaN
+        out_of_range |= np.isinf(values)
+        out_of_range |= self.exclusive_minimum & (values == self.minimum)
+        errors[unchecked & out_of_range] = OUT_OF_RANGE
+        if self.integer.any():
+            fractional = self.integer & (values != np.floor(values))
+            errors[(errors == OK) & fractional] = NOT_INTEGER
+        return ValidationResult(errors, self.fields)
+
+
+DEFAULT_SCHEMA = CompiledSchema()
+
+
+def _is_series(balances) -> bool:
+    """True for a 1-D sequence of finite numbers (a raw monthly_balances series)."""
+    try:
+        array = np.asarray(balances)
+    except ValueError:  # ragged nesting
+        return False
+    return array.ndim == 1 and array.dtype.kind in "iuf" and bool(np.isfinite(array).all())
+
+
+def _bad_series_rows(balances) -> np.ndarray:
+    """Row mask of monthly_balances series that are not 1-D, numeric and finite."""
+    if isinstance(balances, TransactionSeries):
+        bad = np.zeros(len(balances), dtype=bool)
+        positions = np.flatnonzero(~np.isfinite(balances.values))
+        bad[np.searchsorted(balances.offsets, positions, side="right") - 1] = True
+        return bad
+    return np.array([b is not None and not _is_series(b) for b in balances], dtype=bool)
@@ -0,0 +1,210 @@
+"""
+Asyncio scoring service with micro-batching.
+
+Concurrent single-application requests are gathered into micro-batches
+(up to max_batch_size, waiting at most max_wait_ms for the batch to fill)
+and scored with one predict_batch call on a worker thread, so the event
+loop keeps accepting requests while a batch is being scored.
+
+    python src/service.py --port 8080 --model models/credit_model.safetensors
+    python src/service.py --unix /run/credit-scoring.sock
+
+    POST /score   body: one application as JSON  ->  predict() result
+    GET  /healthz
+    GET  /metrics  (with --metrics) Prometheus text format
+"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from model import CreditScoringModel
+
+
+class MicroBatcher:
+    """Collects concurrent score() calls into batched predict_batch calls."""
+
+    def __init__(self, model: CreditScoringModel, max_batch_size: int = 256,
+                 max_wait_ms: float = 2.0, executor: ThreadPoolExecutor = None):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="scorer")
+        self._queue = None
+        self._task = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def score(self, features: dict) -> dict:
+        """Score one application; resolved when its micro-batch completes."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            features = [item[0] for item in batch]
+            futures = [item[1] for item in batch]
+            try:
+                results = await loop.run_in_executor(self._executor, self._score_batch, features)
+            except Exception:
+                # One malformed application must not fail its neighbours
+                results = await loop.run_in_executor(self._executor, self._score_each, features)
+            for future, result in zip(futures, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _score_batch(self, features: list) -> list:
+        # Invalid rows come back as rejections instead of failing the batch
+        return self.model.predict_batch(features, on_invalid="reject")
+
+    def _score_each(self, features: list) -> list:
+        results = []
+        for application in features:
+            try:
+                results.append(self.model.predict(application))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+class ScoringService:
+    """Minimal HTTP/1.1 front-end (TCP or Unix socket) for a MicroBatcher."""
+
+    def __init__(self, batcher: MicroBatcher):
+        self.batcher = batcher
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = await self._dispatch(method, path, body)
+                if isinstance(payload, str):
+                    content_type, data = "text/plain; version=0.0.4", payload.encode()
+                else:
+                    content_type, data = "application/json", json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes):
+        if method == "GET" and path == "/healthz":
+            return "200 OK", {"status": "ok", "model_version": self.batcher.model.version}
+        if method == "GET" and path == "/metrics" and self.batcher.model.metrics is not None:
+            return "200 OK", self.batcher.model.metrics.to_prometheus()
+        if method != "POST" or path != "/score":
+            return "404 Not Found", {"error": f"{method} {path} not found"}
+        try:
+            features = json.loads(body)
+        except json.JSONDecodeError as e:
+            return "400 Bad Request", {"error": f"Invalid JSON: {e}"}
+        if not isinstance(features, dict):
+            return "422 Unprocessable Entity", {"error": "Invalid application: expected a JSON object"}
+        try:
+            result = await self.batcher.score(features)
+        except (KeyError, TypeError, ValueError) as e:
+            return "422 Unprocessable Entity", {"error": f"Invalid application: {e!r}"}
+        if result.get("rejected"):
+            return "422 Unprocessable Entity", {"error": "Invalid application", "errors": result["errors"]}
+        return "200 OK", result
+
+
+async def serve(model: CreditScoringModel, host: str = "127.0.0.1", port: int = 8080,
+                unix_path: str = None, max_batch_size: int = 256, max_wait_ms: float = 2.0):
+    batcher = MicroBatcher(model, max_batch_size, max_wait_ms)
+    await batcher.start()
+    service = ScoringService(batcher)
+    if unix_path:
+        server = await asyncio.start_unix_server(service.handle, path=unix_path)
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Credit scoring service with micro-batching")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--model", help="Path to safetensors weights (loaded memory-mapped)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Compute scores from the weights instead of sampling them")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="LRU result cache of this size (implies --deterministic)")
+    parser.add_argument("--metrics", action="store_true", help="Record stage latencies and expose GET /metrics")
+    args = parser.parse_args(argv)
+
+    options = {"deterministic": args.deterministic or bool(args.cache_size), "cache_size": args.cache_size}
+    model = CreditScoringModel(args.model, **options) if args.model else CreditScoringModel(**options)
+    if args.model:
+        model.load_model(lazy=True)
+    if args.metrics:
+        model.enable_metrics()
+
+    try:
+        asyncio.run(serve(model, args.host, args.port, args.unix, args.max_batch_size, args.max_wait_ms))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Streaming scorer for JSONL/CSV application files.
+
+Reads applications in fixed-size chunks, scores each chunk with one
+predict_batch call and writes results out before reading the next chunk,
+so memory stays bounded by the chunk size.
+
+    python src/stream.py applications.jsonl -o scores.jsonl
+    cat applications.csv | python src/stream.py - --format csv --model models/credit_model.safetensors
+"""
+
+import argparse
+import csv
+import json
+import sys
+from collections import deque
+from itertools import islice
+
+from application import APPLICATION_FIELDS
+from model import CreditScoringModel
+from parallel import ParallelScorer
+
+OUTPUT_FIELDS = ("score", "recommendation", "confidence", "requires_human_review", "model_version")
+
+# Added to rows that failed input validation; their score fields are empty
+ERRORS_FIELD = "errors"
+
+# Optional input column copied to each output row so results can be joined back.
+# CSV output always has the column (ids may only appear in later chunks).
+ID_FIELD = "id"
+
+
+def read_jsonl_chunks(infile, chunk_size: int):
+    """
+    Yield (ids, feature dicts, rejected), chunk_size lines at a time.
+
+    Lines that are not a JSON object are left out of the feature dicts;
+    rejected maps their position in the chunk to an error list.
+    """
+    lines = ((number, line) for number, line in enumerate(infile, 1) if line.strip())
+    while True:
+        ids, chunk, rejected = [], [], {}
+        for i, (number, line) in enumerate(islice(lines, chunk_size)):
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                row = None
+                rejected[i] = [f"line {number}: invalid JSON ({e.msg})"]
+            else:
+                if not isinstance(row, dict):
+                    rejected[i] = [f"line {number}: expected a JSON object"]
+            if i in rejected:
+                ids.append(None)
+            else:
+                ids.append(row.get(ID_FIELD))
+                chunk.append(row)
+        if not ids:
+            return
+        yield ids, chunk, rejected
+
+
+def read_csv_chunks(infile, chunk_size: int):
+    """
+    Yield columnar dicts, chunk_size rows at a time.
+
+    The CSV header must contain the APPLICATION_FIELDS columns; the
+    transaction component is read from an avg_monthly_balance column.
+    """
+    reader = csv.DictReader(infile)
+    while True:
+        rows = list(islice(reader, chunk_size))
+        if not rows:
+            return
+        columns = {
+            name: [_parse_number(row.get(name), _CSV_DEFAULTS.get(name)) for row in rows]
+            for name in APPLICATION_FIELDS
+        }
+        yield [row.get(ID_FIELD) for row in rows], columns, {}
+
+
+# Empty cells in required columns are left as None so validation reports them
+_CSV_DEFAULTS = {"avg_monthly_balance": 0.0}
+
+
+def _parse_number(text: str, default=None):
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return text  # rejected by validation as "must be a number"
+
+
+READERS = {"jsonl": read_jsonl_chunks, "csv": read_csv_chunks}
+
+
+class _JsonlWriter:
+    def __init__(self, outfile):
+        self.outfile = outfile
+
+    def write(self, rows):
+        self.outfile.write("".join(json.dumps(row) + "\n" for row in rows))
+
+
+class _CsvWriter:
+    def __init__(self, outfile):
+        fields = (ID_FIELD,) + OUTPUT_FIELDS + (ERRORS_FIELD,)
+        self.writer = csv.DictWriter(outfile, fieldnames=fields, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, rows):
+        self.writer.writerows(
+            dict(row, **{ERRORS_FIELD: "; ".join(row[ERRORS_FIELD])}) if ERRORS_FIELD in row else row
+            for row in rows
+        )
+
+
+def score_stream(infile, outfile, model: CreditScoringModel, input_format: str = "jsonl",
+                 output_format: str = "jsonl", chunk_size: int = 10_000,
+                 scorer: ParallelScorer = None) -> int:
+    """
+    Score every application in infile and write one result per row to outfile.
+
+    When a ParallelScorer is given, chunks are scored on its worker pool
+    instead of in-process. Invalid applications do not stop the stream:
+    their output row carries an "errors" list instead of a score. Returns
+    the number of rows written.
+    """
+    chunks = READERS[input_format](infile, chunk_size)
+    if scorer is None:
+        scored = ((ids, rejected, model.predict_batch(chunk, explain_top_k=0, on_invalid="reject"))
+                  for ids, chunk, rejected in chunks)
+    else:
+        pending = deque()
+
+        def _chunks():
+            for ids, chunk, rejected in chunks:
+                pending.append((ids, rejected))
+                yield chunk
+
+        scored = (pending.popleft() + (results,) for results in scorer.imap(_chunks()))
+
+    writer = None
+    total = 0
+    for ids, rejected, results in scored:
+        with_id = any(i is not None for i in ids)
+        if writer is None:
+            writer = _CsvWriter(outfile) if output_format == "csv" else _JsonlWriter(outfile)
+
+        results = iter(results)
+        rows = []
+        for i, app_id in enumerate(ids):
+            row = {ID_FIELD: app_id} if with_id else {}
+            result = None if i in rejected else next(results)
+            if result is None:
+                row.update(model_version=model.version, errors=rejected[i])
+            elif result.get("rejected"):
+                row.update(model_version=result["model_version"], errors=result["errors"])
+            else:
+                row.update((field, result[field]) for field in OUTPUT_FIELDS)
+            rows.append(row)
+        writer.write(rows)
+        outfile.flush()
+        total += len(rows)
+    return total
+
+
+def _detect_format(path: str, default: str = "jsonl") -> str:
+    if path.endswith(".csv"):
+        return "csv"
+    if path.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return default
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream-score loan applications")
+    parser.add_argument("input", help="JSONL or CSV file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="Output file, or - for stdout")
+    parser.add_argument("--format", choices=sorted(READERS), help="Input format (default: from extension)")
+    parser.add_argument("--output-format", choices=sorted(READERS), help="Output format (default: from extension)")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Rows scored per batch")
+    parser.add_argument("--model", help="Path to safetensors weights (loaded memory-mapped)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: score in-process)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Compute scores from the weights instead of sampling them (reproducible)")
+    parser.add_argument("--seed", type=int, help="Seed for sampled scores")
+    args = parser.parse_args(argv)
+
+    options = {"deterministic": args.deterministic, "seed": args.seed}
+    model = CreditScoringModel(args.model, **options) if args.model else CreditScoringModel(**options)
+    if args.model:
+        model.load_model(lazy=True)
+
+    input_format = args.format or _detect_format(args.input)
+    output_format = args.output_format or _detect_format(args.output)
+
+    infile = sys.stdin if args.input == "-" else open(args.input, newline="")
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    scorer = ParallelScorer(args.model, args.workers, explain_top_k=0, on_invalid="reject",
+                            **options) if args.workers > 1 else None
+    try:
+        total = score_stream(infile, outfile, model, input_format, output_format,
+                             args.chunk_size, scorer)
+    finally:
+        if scorer is not None:
+            scorer.close()
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    print(f"Scored {total} applications", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Vectorized transaction-history aggregation.
+
+Raw per-applicant series (monthly balances, transaction amounts) for a whole
+batch are stored in one ragged, offset-indexed buffer: applicant i owns
+values[offsets[i]:offsets[i + 1]], oldest first. Aggregates over the most
+recent `window` entries are computed for every applicant at once.
+"""
+
+import numpy as np
+
+
+class TransactionSeries:
+    """Ragged buffer of one numeric series per applicant."""
+
+    __slots__ = ("values", "offsets")
+
+    def __init__(self, values: np.ndarray, offsets: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(values):
+            raise ValueError("offsets must start at 0 and end at len(values)")
+        if np.any(np.diff(offsets) < 0):
+            raise ValueError("offsets must be non-decreasing")
+        self.values = values
+        self.offsets = offsets
+
+    @classmethod
+    def from_sequences(cls, sequences) -> "TransactionSeries":
+        """Pack a sequence of per-applicant arrays (None for no history)."""
+        arrays = [np.asarray(s if s is not None else (), dtype=np.float64).reshape(-1) for s in sequences]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([len(a) for a in arrays], out=offsets[1:])
+        values = np.concatenate(arrays) if arrays else np.empty(0)
+        return cls(values, offsets)
+
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def take(self, indices) -> "TransactionSeries":
+        """Series of the given applicants, in the given order."""
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.offsets[:-1][indices]
+        lengths = self.offsets[1:][indices] - starts
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        positions = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return TransactionSeries(self.values[positions], offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("TransactionSeries only supports contiguous slices")
+            offsets = self.offsets[start:stop + 1]
+            return TransactionSeries(self.values[offsets[0]:offsets[-1]], offsets - offsets[0])
+        return self.values[self.offsets[index]:self.offsets[index + 1]]
+
+
+def rolling_aggregates(series: TransactionSeries, window: int = 12) -> dict:
+    """
+    Aggregate the last `window` entries of every applicant's series.
+
+    Returns a dict of arrays, one value per applicant: count, sum, mean,
+    min, max, std and change (last minus first entry in the window).
+    Applicants with an empty series get zeros.
+    """
+    ends = series.offsets[1:]
+    starts = np.maximum(series.offsets[:-1], ends - window)
+    count = ends - starts
+    has_data = count > 0
+
+    # Prefix sums over values centred on the global mean, which keeps the
+    # variance computation numerically stable for large balances.
+    shift = series.values.mean() if len(series.values) else 0.0
+    centred = series.values - shift
+    cumsum = np.concatenate(([0.0], np.cumsum(centred)))
+    cumsq = np.concatenate(([0.0], np.cumsum(centred ** 2)))
+    centred_total = cumsum[ends] - cumsum[starts]
+    total_sq = cumsq[ends] - cumsq[starts]
+
+    safe_count = np.where(has_data, count, 1)
+    centred_mean = centred_total / safe_count
+    std = np.sqrt(np.maximum(total_sq / safe_count - centred_mean ** 2, 0.0))
+    mean = centred_mean + shift
+    total = centred_total + shift * count
+
+    # Interleave [start_i, end_i] so reduceat only sees each window; the
+    # sentinel keeps end == len(values) a valid index.
+    padded = np.append(series.values, 0.0)
+    bounds = np.empty(2 * len(starts), dtype=np.int64)
+    bounds[0::2] = starts
+    bounds[1::2] = ends
+    if len(bounds):
+        minimum = np.minimum.reduceat(padded, bounds)[0::2]
+        maximum = np.maximum.reduceat(padded, bounds)[0::2]
+        change = padded[np.maximum(ends - 1, 0)] - padded[starts]
+    else:
+        minimum = maximum = change = np.empty(0)
+
+    zero = np.zeros_like(mean)
+    return {
+        "count": count,
+        "sum": total,
+        "mean": np.where(has_data, mean, zero),
+        "min": np.where(has_data, minimum, zero),
+        "max": np.where(has_data, maximum, zero),
+        "std": np.where(count > 1, std, zero),
+        "change": np.where(has_data, change, zero),
+    }
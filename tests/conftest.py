@@ -0,0 +1,19 @@
+"""Put src/ and the repository root (annexci.py) on the import path."""
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+for path in (ROOT_DIR / "src", ROOT_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# The example application from src/model.py, shared by the tests
+APPLICATION = {
+    "income_annual": 75000,
+    "employment_length_months": 36,
+    "credit_history_length_months": 84,
+    "existing_debt": 15000,
+    "requested_amount": 25000,
+    "transaction_history": {"avg_monthly_balance": 5000},
+}
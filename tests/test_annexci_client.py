@@ -0,0 +1,87 @@
+"""AnnexCIClient retry behaviour against an in-process stand-in server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from annexci import AnnexCIClient, AnnexCIError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """/status/<code> answers with that status; /slow sleeps past the read timeout."""
+
+    def _respond(self):
+        self.server.hits.append((self.command, self.path))
+        if self.command == "POST":
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/slow":
+            time.sleep(0.5)
+        status = int(self.path.rsplit("/", 1)[1]) if self.path.startswith("/status/") else 200
+        body = json.dumps({"status": status}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        pass  # the client hanging up on /slow is expected
+
+
+@pytest.fixture
+def server():
+    httpd = _Server(("127.0.0.1", 0), _Handler)
+    httpd.hits = []
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(server):
+    with AnnexCIClient(f"http://127.0.0.1:{server.server_port}", retries=3, backoff=0) as client:
+        yield client
+
+
+def test_success_and_missing_ok(client, server):
+    assert client.post("/status/200", {"a": 1}) == {"status": 200}
+    assert client.post("/status/404", missing_ok=True) is None
+    assert len(server.hits) == 2
+
+
+@pytest.mark.parametrize("status", [502, 504])
+def test_post_is_not_resent_on_gateway_errors(client, server, status):
+    with pytest.raises(AnnexCIError, match=f"HTTP {status}"):
+        client.post(f"/status/{status}", {"scan": 1})
+    assert server.hits == [("POST", f"/status/{status}")]
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_post_is_retried_when_turned_away(client, server, status):
+    with pytest.raises(AnnexCIError, match="retryable status"):
+        client.post(f"/status/{status}", {"scan": 1})
+    assert len(server.hits) == 4
+
+
+def test_get_is_retried_on_gateway_errors(client, server):
+    with pytest.raises(AnnexCIError, match="retryable status"):
+        client.get("/status/504")
+    assert len(server.hits) == 4
+
+
+def test_read_timeout_is_not_retried(client, server):
+    with pytest.raises(AnnexCIError, match="timed out"):
+        client.post("/slow", {"scan": 1}, timeout=(1, 0.1))
+    assert len(server.hits) == 1
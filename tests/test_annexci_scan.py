@@ -0,0 +1,56 @@
+"""Source rules of the compliance scan (check_source)."""
+
+import textwrap
+
+from annexci import check_source
+
+
+def _rules(source):
+    return [(rule_id, line) for _, line, _, rule_id in check_source(textwrap.dedent(source))]
+
+
+def test_aliased_from_import_is_resolved():
+    source = """
+        from pickle import loads as l
+        l(b"")
+    """
+    assert _rules(source) == [("unsafe-deserialization", 3)]
+
+
+def test_eval_in_comments_and_strings_is_not_flagged():
+    source = """
+        # never call eval(user_input) here
+        doc = "eval(x) is forbidden"
+        print(doc)
+    """
+    assert _rules(source) == []
+
+
+def test_yaml_load_requires_safe_loader():
+    source = """
+        import yaml
+        yaml.load(stream)
+        yaml.load(stream, Loader=yaml.SafeLoader)
+        yaml.load(stream, yaml.CSafeLoader)
+    """
+    assert _rules(source) == [("unsafe-yaml-load", 3)]
+
+
+def test_torch_load_requires_weights_only():
+    source = """
+        import torch
+        torch.load("a.pt")
+        torch.load("b.pt", weights_only=False)
+        torch.load("c.pt", weights_only=True)
+    """
+    assert _rules(source) == [("torch-load-weights-only", 3), ("torch-load-weights-only", 4)]
+
+
+def test_unparsable_file_falls_back_to_patterns():
+    source = """
+        import pickle
+        print "python 2"
+        data = pickle.loads(blob)
+        exec(code)
+    """
+    assert _rules(source) == [("unsafe-deserialization", 4), ("dynamic-code-execution", 5)]
@@ -0,0 +1,37 @@
+"""The Article 12 log records decisions as made and reports lost writes."""
+
+import json
+
+import pytest
+
+from conftest import APPLICATION
+from decision_log import DecisionLogWriter
+from model import CreditScoringModel
+
+
+def _records(directory):
+    return [json.loads(line) for path in sorted(directory.iterdir()) for line in path.read_text().splitlines()]
+
+
+def test_caller_changes_do_not_reach_the_log(tmp_path):
+    model = CreditScoringModel(seed=0)
+    with DecisionLogWriter(tmp_path) as log:
+        model.decision_log = log
+        result = model.predict_batch([APPLICATION])[0]
+        score, impact = result["score"], result["explanation"][0]["impact"]
+        result["score"] = -1
+        result["explanation"][0]["impact"] = 99
+    [record] = _records(tmp_path)
+    assert record["score"] == score
+    assert record["explanation"][0]["impact"] == impact
+
+
+@pytest.mark.parametrize("finish", ["flush", "close"])
+def test_failed_write_is_raised_by_flush_and_close(tmp_path, finish):
+    log = DecisionLogWriter(tmp_path)
+    log.log({"score": object()})  # not JSON serializable
+    with pytest.raises(RuntimeError, match="writer failed"):
+        getattr(log, finish)()
+    if finish == "flush":
+        with pytest.raises(RuntimeError):
+            log.close()
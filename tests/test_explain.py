@@ -0,0 +1,17 @@
+import numpy as np
+
+from explain import explain_batch
+
+
+def test_top_k_drops_zero_and_negative_zero_contributions():
+    X = np.array([[1.0, 2.0, -1.0, 0.0001]])
+    coef = np.array([0.5, 0.0, 0.0, 1.0])
+    row = explain_batch(X, coef, ["a", "b", "c", "d"]).top_k(3)[0]
+    assert row == [{"feature": "a", "impact": 0.5, "direction": "positive"}]
+
+
+def test_top_k_orders_by_magnitude_with_direction():
+    X = np.array([[1.0, 1.0, 1.0]])
+    coef = np.array([0.1, -0.3, 0.2])
+    row = explain_batch(X, coef, ["a", "b", "c"]).top_k(2)[0]
+    assert [(e["feature"], e["direction"]) for e in row] == [("b", "negative"), ("c", "positive")]
@@ -0,0 +1,40 @@
+"""Deterministic scoring and its result cache."""
+
+import numpy as np
+import pytest
+from safetensors.numpy import save_file
+
+from conftest import APPLICATION
+from model import CreditScoringModel
+
+
+def test_cache_is_invalidated_by_new_scoring_parameters():
+    model = CreditScoringModel(deterministic=True, cache_size=10)
+    model.predict(APPLICATION)
+    model.coef = np.array([0.5, 0.1, 0.4, -0.3, 0.0, 0.1])
+    model._set_scaler_stats(model.scaler_mean * 0.9, model.scaler_scale)
+
+    fresh = CreditScoringModel(deterministic=True)
+    fresh.coef = model.coef
+    fresh._set_scaler_stats(model.scaler_mean, model.scaler_scale)
+    assert model.predict(APPLICATION) == fresh.predict(APPLICATION)
+
+
+def test_cache_hits_do_not_share_explanations():
+    model = CreditScoringModel(deterministic=True, cache_size=10)
+    first = model.predict(APPLICATION)
+    expected = [dict(item) for item in first["explanation"]]
+    first["explanation"][0]["impact"] = 99
+    first["explanation"].append({"feature": "junk"})
+    assert model.predict(APPLICATION)["explanation"] == expected
+
+
+def test_load_model_requires_complete_scaler_statistics(tmp_path):
+    path = str(tmp_path / "model.safetensors")
+    save_file({"scaler.mean": np.zeros(6)}, path)
+    with pytest.raises(ValueError, match="scaler.scale is missing"):
+        CreditScoringModel(path).load_model()
+
+    save_file({"scoring.coef": np.ones(6)}, path)
+    with pytest.warns(RuntimeWarning, match="no fitted scaler statistics"):
+        CreditScoringModel(path).load_model(lazy=True)
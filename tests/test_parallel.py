@@ -0,0 +1,12 @@
+"""ParallelScorer matches in-process scoring in deterministic mode."""
+
+from conftest import APPLICATION
+from model import CreditScoringModel
+from parallel import score_parallel
+
+
+def test_deterministic_parallel_scores_are_reproducible():
+    rows = [dict(APPLICATION, income_annual=40_000 + 1_000 * i) for i in range(40)]
+    first = score_parallel(rows, workers=2, chunk_size=7, deterministic=True)
+    assert score_parallel(rows, workers=2, chunk_size=7, deterministic=True) == first
+    assert first == CreditScoringModel(deterministic=True).predict_batch(rows)
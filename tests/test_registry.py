@@ -0,0 +1,42 @@
+"""Smoke tests for ModelRegistry loading, warm-up and hot swap."""
+
+import pytest
+
+from conftest import APPLICATION
+from model import CreditScoringModel
+from registry import ModelRegistry
+
+
+@pytest.fixture
+def weights_path(tmp_path):
+    path = str(tmp_path / "credit_model.safetensors")
+    CreditScoringModel(path).save_model()
+    return path
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_get_loads_warms_and_shares_model(weights_path, lazy):
+    registry = ModelRegistry(lazy=lazy)
+    model = registry.get(weights_path)
+    assert registry.get(weights_path) is model
+    assert model.predict(APPLICATION)["model_version"] == model.version
+
+
+def test_swap_replaces_active_model(weights_path):
+    registry = ModelRegistry()
+    old = registry.get(weights_path)
+    new = registry.swap(weights_path, weights_path, version="2.2.0").result(timeout=30)
+    assert registry.get(weights_path) is new
+    assert registry.get(weights_path, old.version) is old
+    assert registry.versions(weights_path) == ["2.1.0", "2.2.0"]
+    assert new.predict(APPLICATION)["model_version"] == "2.2.0"
+
+
+def test_unregistered_version_raises_key_error(weights_path):
+    registry = ModelRegistry()
+    with pytest.raises(KeyError, match="1.0.0"):
+        registry.get(weights_path, version="1.0.0")
+    registry.get(weights_path)
+    with pytest.raises(KeyError):
+        registry.get(weights_path, version="1.0.0")
+    assert registry.versions(weights_path) == ["2.1.0"]
@@ -0,0 +1,86 @@
+"""Review queue priority, claims and batch enqueueing."""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+import review_queue
+from conftest import APPLICATION
+from model import FEATURE_NAMES, CreditScoringModel
+from review_queue import ReviewQueue
+
+
+def _flagged(n):
+    return [{"requires_human_review": True} for _ in range(n)]
+
+
+def _raw(amounts):
+    raw = np.zeros((len(amounts), 5))
+    raw[:, 4] = amounts
+    return raw
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = ReviewQueue(str(tmp_path / "review.db"))
+    yield queue
+    queue.close()
+
+
+def test_dequeue_by_amount_then_age(queue, monkeypatch):
+    monkeypatch.setattr(review_queue.time, "time", lambda: 100.0)
+    queue.enqueue_batch(_raw([20000, 50000]), _flagged(2))
+    monkeypatch.setattr(review_queue.time, "time", lambda: 200.0)
+    queue.enqueue_batch(_raw([50000, 90000]), _flagged(2))
+
+    claimed = [queue.dequeue("reviewer") for _ in range(4)]
+    assert [(item["requested_amount"], item["enqueued_at"]) for item in claimed] == [
+        (90000, 200.0), (50000, 100.0), (50000, 200.0), (20000, 100.0)
+    ]
+    assert queue.dequeue("reviewer") is None
+
+
+def test_release_and_release_stale(queue, monkeypatch):
+    queue.enqueue_batch(_raw([30000, 20000]), _flagged(2))
+    monkeypatch.setattr(review_queue.time, "time", lambda: 1000.0)
+    first = queue.dequeue("a")
+    monkeypatch.setattr(review_queue.time, "time", lambda: 1100.0)
+    second = queue.dequeue("b")
+    assert queue.pending() == 0
+
+    queue.release(second["id"])
+    assert queue.pending() == 1
+    assert queue.dequeue("c")["id"] == second["id"]
+
+    monkeypatch.setattr(review_queue.time, "time", lambda: 1150.0)
+    assert queue.release_stale(120) == 1  # only the claim taken at t=1000
+    assert queue.dequeue("d")["id"] == first["id"]
+
+    queue.complete(first["id"])
+    queue.release(first["id"])
+    assert queue.pending() == 0
+
+
+def test_failed_batch_is_rolled_back(queue):
+    # NaN is stored as NULL and violates NOT NULL on requested_amount
+    with pytest.raises(sqlite3.IntegrityError):
+        queue.enqueue_batch(_raw([20000, float("nan")]), _flagged(2))
+    assert queue.pending() == 0
+    assert queue.enqueue_batch(_raw([20000]), _flagged(1)) == 1
+
+
+def test_predict_batch_enqueues_flagged_rows(tmp_path):
+    queue = ReviewQueue(str(tmp_path / "review.db"), feature_names=FEATURE_NAMES)
+    model = CreditScoringModel()
+    model.review_queue = queue
+    small = dict(APPLICATION, requested_amount=5000)
+    results = model.predict_batch([APPLICATION, small, dict(APPLICATION, requested_amount=40000)])
+
+    flagged = sum(r["requires_human_review"] for r in results)
+    assert flagged >= 2 and queue.pending() == flagged
+    item = queue.dequeue("reviewer")
+    assert item["requested_amount"] == 40000
+    assert item["features"]["requested_amount"] == 40000
+    assert item["decision"]["requires_human_review"] is True
+    queue.close()
@@ -0,0 +1,39 @@
+"""Malformed inputs are rejected row by row instead of aborting the batch."""
+
+import numpy as np
+import pytest
+
+from conftest import APPLICATION
+from model import CreditScoringModel
+from schema import DEFAULT_SCHEMA, WRONG_TYPE
+
+
+def test_non_mapping_rows_are_wrong_type():
+    validation = DEFAULT_SCHEMA.validate([[1, 2, 3], APPLICATION, None])
+    assert validation.valid.tolist() == [False, True, False]
+    assert (validation.errors[[0, 2]] == WRONG_TYPE).all()
+
+
+def test_reject_keeps_valid_rows():
+    results = CreditScoringModel(seed=0).predict_batch([[1, 2, 3], APPLICATION], on_invalid="reject")
+    assert results[0]["rejected"] and len(results[0]["errors"]) == len(DEFAULT_SCHEMA.fields)
+    assert "score" in results[1]
+
+
+@pytest.mark.parametrize("shape", [(6,), (2, 5), (1, 2, 6)])
+def test_wrong_matrix_shape_raises_value_error(shape):
+    with pytest.raises(ValueError, match="expected shape"):
+        CreditScoringModel().predict_batch(np.zeros(shape))
+
+
+@pytest.mark.parametrize("balances", [["x", 1], [[1, 2], [3]], [1, float("inf")], "12"])
+def test_malformed_monthly_balances_are_rejected(balances):
+    bad = dict(APPLICATION, transaction_history={"monthly_balances": balances})
+    results = CreditScoringModel(seed=0).predict_batch([bad, APPLICATION], on_invalid="reject")
+    assert results[0]["rejected"] and results[0]["errors"] == ["avg_monthly_balance: must be a number"]
+    assert "score" in results[1]
+
+
+def test_non_finite_values_are_out_of_range():
+    validation = DEFAULT_SCHEMA.validate([dict(APPLICATION, income_annual=float("inf"), existing_debt=float("nan"))])
+    assert validation.messages(0) == ["income_annual: out of range [0, inf]", "existing_debt: out of range [0, inf]"]
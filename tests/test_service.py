@@ -0,0 +1,75 @@
+"""ScoringService request handling on top of the micro-batcher."""
+
+import asyncio
+import json
+
+from conftest import APPLICATION
+from model import CreditScoringModel
+from service import MicroBatcher, ScoringService
+
+
+class _RecordingBatcher(MicroBatcher):
+    """Records every batch; fail_batches forces the per-row fallback."""
+
+    def __init__(self, model, fail_batches=False):
+        super().__init__(model, max_batch_size=64, max_wait_ms=50)
+        self.fail_batches = fail_batches
+        self.batches = []
+        self.fallbacks = []
+
+    def _score_batch(self, features):
+        self.batches.append(len(features))
+        if self.fail_batches:
+            raise RuntimeError("batch scoring failed")
+        return super()._score_batch(features)
+
+    def _score_each(self, features):
+        self.fallbacks.append(len(features))
+        return super()._score_each(features)
+
+
+_BODIES = [
+    json.dumps(APPLICATION).encode(),
+    b"{not json",
+    b"[1, 2]",
+    json.dumps({k: v for k, v in APPLICATION.items() if k != "income_annual"}).encode(),
+    json.dumps(dict(APPLICATION, requested_amount=5000)).encode(),
+]
+
+
+async def _post_all(batcher):
+    await batcher.start()
+    try:
+        service = ScoringService(batcher)
+        return await asyncio.gather(*(service._dispatch("POST", "/score", body) for body in _BODIES))
+    finally:
+        await batcher.stop()
+
+
+def _check_responses(responses, expected):
+    statuses = [status for status, _ in responses]
+    assert statuses == ["200 OK", "400 Bad Request", "422 Unprocessable Entity",
+                        "422 Unprocessable Entity", "200 OK"]
+    assert [payload["score"] for _, payload in (responses[0], responses[4])] == expected
+
+
+def test_valid_and_invalid_bodies_share_one_micro_batch():
+    model = CreditScoringModel(deterministic=True)
+    expected = [r["score"] for r in model.predict_batch([APPLICATION, dict(APPLICATION, requested_amount=5000)])]
+    batcher = _RecordingBatcher(model)
+    responses = asyncio.run(_post_all(batcher))
+
+    _check_responses(responses, expected)
+    assert responses[3][1]["errors"]  # rejected by validation inside the batch
+    assert batcher.batches == [3] and batcher.fallbacks == []
+
+
+def test_failed_batch_falls_back_to_scoring_each_row():
+    model = CreditScoringModel(deterministic=True)
+    expected = [r["score"] for r in model.predict_batch([APPLICATION, dict(APPLICATION, requested_amount=5000)])]
+    batcher = _RecordingBatcher(model, fail_batches=True)
+    responses = asyncio.run(_post_all(batcher))
+
+    _check_responses(responses, expected)
+    assert "income_annual" in responses[3][1]["error"]  # predict() raised for this row only
+    assert batcher.batches == [3] and batcher.fallbacks == [3]
@@ -0,0 +1,34 @@
+"""Bad JSONL lines become error rows instead of stopping the stream."""
+
+import csv
+import io
+import json
+
+from conftest import APPLICATION
+from model import CreditScoringModel
+from stream import score_stream
+
+GOOD = json.dumps(dict(APPLICATION, id="a"))
+
+
+def test_malformed_lines_are_written_as_errors():
+    infile = io.StringIO("\n".join([GOOD, "[1, 2]", "", '{"id": "b", ', GOOD]) + "\n")
+    outfile = io.StringIO()
+    assert score_stream(infile, outfile, CreditScoringModel(seed=0), chunk_size=2) == 4
+
+    rows = [json.loads(line) for line in outfile.getvalue().splitlines()]
+    assert [row["id"] for row in rows] == ["a", None, None, "a"]
+    assert rows[1]["errors"] == ["line 2: expected a JSON object"]
+    assert rows[2]["errors"][0].startswith("line 4: invalid JSON")
+    assert "score" in rows[0] and "score" in rows[3]
+
+
+def test_csv_output_keeps_ids_that_first_appear_in_later_chunks():
+    no_id = json.dumps(APPLICATION)
+    infile = io.StringIO("\n".join([no_id, no_id, GOOD, no_id]) + "\n")
+    outfile = io.StringIO()
+    score_stream(infile, outfile, CreditScoringModel(seed=0), output_format="csv", chunk_size=2)
+
+    rows = list(csv.DictReader(io.StringIO(outfile.getvalue())))
+    assert [row["id"] for row in rows] == ["", "", "a", ""]
+    assert all(row["score"] for row in rows)
@@ -0,0 +1,58 @@
+"""Vectorized aggregates and take() against a per-applicant reference."""
+
+import numpy as np
+import pytest
+
+from transactions import TransactionSeries, rolling_aggregates
+
+
+def _reference(sequences, window):
+    rows = []
+    for seq in sequences:
+        tail = np.asarray(seq, dtype=np.float64)[-window:]
+        if not len(tail):
+            rows.append(dict(count=0, sum=0.0, mean=0.0, min=0.0, max=0.0, std=0.0, change=0.0))
+            continue
+        rows.append(dict(
+            count=len(tail), sum=tail.sum(), mean=tail.mean(), min=tail.min(), max=tail.max(),
+            std=tail.std() if len(tail) > 1 else 0.0, change=tail[-1] - tail[0],
+        ))
+    return {key: np.array([row[key] for row in rows]) for key in rows[0]} if rows else {}
+
+
+def _random_sequences(rng, n, scale=1.0):
+    # Mix of empty, shorter-than-window and longer-than-window histories
+    return [rng.normal(5000, 2000, rng.integers(0, 30)) * scale for _ in range(n)]
+
+
+@pytest.mark.parametrize("window", [1, 3, 12, 50])
+@pytest.mark.parametrize("scale", [1.0, 1e6])
+def test_rolling_aggregates_match_reference(window, scale):
+    sequences = _random_sequences(np.random.default_rng(window), 200, scale)
+    sequences[0] = []
+    sequences[-1] = []  # last window ends at len(values), the reduceat sentinel
+    result = rolling_aggregates(TransactionSeries.from_sequences(sequences), window)
+    expected = _reference(sequences, window)
+    for key, values in expected.items():
+        np.testing.assert_allclose(result[key], values, rtol=1e-9, atol=1e-9 * scale, err_msg=key)
+
+
+def test_rolling_aggregates_of_empty_batches():
+    result = rolling_aggregates(TransactionSeries.from_sequences([]))
+    assert all(len(values) == 0 for values in result.values())
+
+    result = rolling_aggregates(TransactionSeries.from_sequences([None, [], None]))
+    for key, values in result.items():
+        np.testing.assert_array_equal(values, np.zeros(3), err_msg=key)
+
+
+def test_take_matches_per_applicant_slicing():
+    sequences = _random_sequences(np.random.default_rng(0), 50)
+    series = TransactionSeries.from_sequences(sequences)
+    indices = [49, 0, 7, 7, 23, 1]
+    taken = series.take(indices)
+
+    assert len(taken) == len(indices)
+    for i, j in enumerate(indices):
+        np.testing.assert_array_equal(taken[i], sequences[j])
+    assert len(series.take([])) == 0